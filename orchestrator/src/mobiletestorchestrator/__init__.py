@@ -4,16 +4,36 @@ import os
 import platform
 import shutil
 from pathlib import Path
-from typing import Iterator, AsyncIterator, Any
+from typing import Iterable, AsyncIterator, Any, Sequence
 
 
 logging.basicConfig(level=logging.DEBUG if os.environ.get("MTO_LOG_DEBUG") else logging.WARNING)
 
 
-async def _async_iter_adapter(iter: Iterator[Any]) -> AsyncIterator[Any]:
-    for item in iter:
-        yield item
-        await asyncio.sleep(0)
+async def _async_iter_adapter(iterable: Iterable[Any]) -> AsyncIterator[Any]:
+    """
+    Adapt a (possibly blocking) iterable to an async iterator.  Sequences are already in memory and are iterated
+    directly;  for any other iterable, items are pulled in the loop's default executor and the next item is
+    prefetched while the client works on the current one
+    """
+    if isinstance(iterable, Sequence):
+        for item in iterable:
+            yield item
+        return
+    iterator = iter(iterable)
+    sentinel = object()
+    loop = asyncio.get_running_loop()
+    next_item = loop.run_in_executor(None, next, iterator, sentinel)
+    try:
+        while True:
+            item = await next_item
+            if item is sentinel:
+                break
+            next_item = loop.run_in_executor(None, next, iterator, sentinel)
+            yield item
+    finally:
+        # client stopped early or was cancelled: do not leave the prefetch dangling
+        next_item.cancel()
 
 
 def _adb_path() -> Path:
@@ -3,11 +3,13 @@ This package holds the API for installing apks, and starting/stopping/querying a
 """
 import asyncio
 import logging
+import os
 import subprocess
 import time
 
 from apk_bitminer.parsing import AXMLParser  # type: ignore
 from contextlib import suppress
+from functools import lru_cache
 from typing import List, TypeVar, Type, Optional, Dict, Union, Set, Iterable, Callable, AsyncIterator
 
 from .device import Device, RemoteDeviceBased, _device_lock
@@ -26,6 +28,33 @@ __all__ = ["Application", "TestApplication", "ServiceApplication",
            "AsyncApplication", "AsyncTestApplication", "AsyncServiceApplication"]
 
 
+@lru_cache(maxsize=64)
+def _parse_manifest_cached(apk_path: str, mtime_ns: int) -> AXMLParser:
+    return AXMLParser.parse(apk_path)
+
+
+def _parse_manifest(apk_path: str) -> AXMLParser:
+    """
+    Parse the manifest of the given apk, reusing a previous parse if the apk has not changed since
+
+    :param apk_path: path to apk
+    :return: parsed manifest of the apk
+    """
+    return _parse_manifest_cached(apk_path, os.stat(apk_path).st_mtime_ns)
+
+
+def _validate_test_manifest(manifest: AXMLParser) -> None:
+    """
+    :param manifest: manifest of a (presumed) test apk
+    :raises: Exception if manifest does not describe a test app (no proper instrumentation element)
+    """
+    valid = (hasattr(manifest, "instrumentation") and (manifest.instrumentation is not None) and
+             bool(manifest.instrumentation.target_package) and bool(manifest.instrumentation.runner))
+    if not valid:
+        raise Exception("Test application's manifest does not specify proper instrumentation element."
+                        "Are you sure this is a test app")
+
+
 class ApplicationBase(RemoteDeviceBased):
 
     # noinspection SpellCheckingInspection
@@ -129,7 +158,7 @@ class Application(ApplicationBase):
 
         >>> app = Application.from_apk("/local/path/to/apk", device, as_upgrade=True)
         """
-        parser = AXMLParser.parse(apk_path)
+        parser = _parse_manifest(apk_path)
         args = []
         if as_upgrade:
             args.append("-r")
@@ -362,7 +391,7 @@ class AsyncApplication(ApplicationBase):
         ...               print(line)
 
         """
-        parser = AXMLParser.parse(apk_path)
+        parser = _parse_manifest(apk_path)
         args = []
         if as_upgrade:
             args.append("-r")
@@ -388,7 +417,7 @@ class AsyncApplication(ApplicationBase):
         :raises IOError if push of apk to device was unsuccessful
         :raises; TimeoutError if install takes more than timeout parameter
         """
-        parser = AXMLParser.parse(apk_path)
+        parser = _parse_manifest(apk_path)
         package = parser.package_name
         remote_data_path = f"/data/local/tmp/{package}"
         try:
@@ -686,12 +715,9 @@ class TestApplication(Application):
         >>> test_app.run()
         """
         super(TestApplication, self).__init__(device=device, manifest=manifest)
-        valid = (hasattr(manifest, "instrumentation") and (manifest.instrumentation is not None) and
-                 bool(manifest.instrumentation.target_package) and bool(manifest.instrumentation.runner))
-        if not valid:
-            raise Exception("Test application's manifest does not specify proper instrumentation element."
-                            "Are you sure this is a test app")
+        _validate_test_manifest(manifest)
         self._runner: str = manifest.instrumentation.runner
+        self._runners: Optional[List[str]] = None  # loaded on-demand first time list_runners called
         self._target_application = Application(device,
                                                manifest={'package_name': manifest.instrumentation.target_package})
         self._permissions = manifest.permissions
@@ -714,12 +740,14 @@ class TestApplication(Application):
         """
         :return: all test runners available for that package
         """
-        items = []
-        for line in self.device.list_instrumentation():
-            if line and self.package_name in line:
-                runner = line.replace('instrumentation:', '').split(' ')[0].strip()
-                items.append(runner)
-        return items
+        if self._runners is None:
+            items = []
+            for line in self.device.list_instrumentation():
+                if line and self.package_name in line:
+                    runner = line.replace('instrumentation:', '').split(' ')[0].strip()
+                    items.append(runner)
+            self._runners = items
+        return self._runners
 
     async def run(self, *options: str) -> Device.AsyncProcessContext:
         """
@@ -789,7 +817,9 @@ class TestApplication(Application):
     def from_apk(cls: Type[_TTestApp], apk_path: str, device: Device, as_upgrade: bool = False,
                  as_test_app: bool = False,
                  timeout: Optional[int] = Device.TIMEOUT_LONG_ADB_CMD) -> _TTestApp:
-        parser = AXMLParser.parse(apk_path)
+        parser = _parse_manifest(apk_path)
+        # fail fast, before paying for an install of an apk that is not a test app
+        _validate_test_manifest(parser)
         args = []
         if as_upgrade:
             args.append("-r")
@@ -817,11 +847,7 @@ class AsyncTestApplication(AsyncApplication):
         >>> test_app.run()
         """
         super().__init__(device=device, manifest=manifest)
-        valid = (hasattr(manifest, "instrumentation") and (manifest.instrumentation is not None) and
-                 bool(manifest.instrumentation.target_package) and bool(manifest.instrumentation.runner))
-        if not valid:
-            raise Exception("Test application's manifest does not specify proper instrumentation element."
-                            "Are you sure this is a test app")
+        _validate_test_manifest(manifest)
         self._runner: str = manifest.instrumentation.runner
         self._target_application = Application(device,
                                                manifest={'package_name': manifest.instrumentation.target_package})
@@ -917,7 +943,9 @@ class AsyncTestApplication(AsyncApplication):
     async def from_apk(cls: Type[_TTestApp], apk_path: str, device: Device, as_upgrade: bool = False,
                        as_test_app: bool = False,
                        timeout: Optional[int] = Device.TIMEOUT_LONG_ADB_CMD) -> _TTestApp:
-        parser = AXMLParser.parse(apk_path)
+        parser = _parse_manifest(apk_path)
+        # fail fast, before paying for an install of an apk that is not a test app
+        _validate_test_manifest(parser)
         args = []
         if as_upgrade:
             args.append("-r")
@@ -35,7 +35,10 @@ from mobiletestorchestrator import ADB_PATH
 log = logging.getLogger(__name__)
 
 
-__all__ = ["Device", "RemoteDeviceBased", "_device_lock"]
+__all__ = ["Device", "RemoteDeviceBased", "_device_lock", "ONLINE_DEVICE_PATTERN"]
+
+# matches the serial of each online device in the output of "adb devices" (excluding offline, unauthorized, ...)
+ONLINE_DEVICE_PATTERN = re.compile(r'^(\S+)[ \t]+device\s*$', re.MULTILINE)
 
 # noinspection PyTypeChecker
 D = TypeVar('D', bound="Device")
@@ -71,6 +74,9 @@ class Device:
     :raises FileNotFoundError: if adb path is invalid
     """
     APP_RECORD_PATTERN = re.compile(r'^\* TaskRecord{[a-f0-9-]* #\d* [AI]=([a-zA-Z].[a-zA-Z0-9.]*)[ /].*')
+    EPOCH_TIME_PATTERN = re.compile(r"^\d+\.\d+$")
+    # echoed between results of commands batched into a single adb shell invocation
+    QUERY_SEPARATOR = "--MTO--"
     UNKNOWN_API_LEVEL = -1
 
     class State(Enum):
@@ -154,6 +160,10 @@ class Device:
             async for line in self._proc.output(unresponsive_timeout=unresponsive_timeout):
                 yield line
 
+        async def output_batches(self, unresponsive_timeout: Optional[float] = None) -> AsyncIterator[List[str]]:
+            async for lines in self._proc.output_batches(unresponsive_timeout=unresponsive_timeout):
+                yield lines
+
         async def stop(self, force: bool = False, timeout: Optional[float] = None) -> None:
             await self._proc.stop(force=force, timeout=timeout)
 
@@ -205,6 +215,35 @@ class Device:
                 else:
                     line = await self._proc.stdout.readline()
 
+        async def output_batches(self, unresponsive_timeout: Optional[float] = None,
+                                 chunk_size: int = 64 * 1024) -> AsyncIterator[List[str]]:
+            """
+            Async iterator over batches of lines of output from process, each batch being all complete lines
+            available from a single read;  lines are in the same form as those yielded by output()
+
+            :param unresponsive_timeout: raise TimeoutException if not None and time to receive next chunk of
+               output exceeds this
+            :param chunk_size: maximum number of bytes to read at a time
+            """
+            if self._proc.stdout is None:
+                raise Exception("Failed to capture output from subprocess")
+            remainder = b''
+            while True:
+                if unresponsive_timeout is not None:
+                    chunk = await asyncio.wait_for(self._proc.stdout.read(chunk_size), timeout=unresponsive_timeout)
+                else:
+                    chunk = await self._proc.stdout.read(chunk_size)
+                if not chunk:
+                    break
+                data = remainder + chunk
+                end = data.rfind(b'\n') + 1
+                remainder = data[end:]
+                if end:
+                    # decode all complete lines in one go, rather than line by line
+                    yield [line + '\n' for line in data[:end - 1].decode('utf-8', errors='ignore').split('\n')]
+            if remainder:
+                yield [remainder.decode('utf-8', errors='ignore')]
+
         async def stop(self, force: bool = False, timeout: Optional[float] = None) -> None:
             """
             Signal process to terminate, and wait for process to end
@@ -311,16 +350,51 @@ class Device:
         :raises FileNotFoundError: if adb path is invalid
         """
         self._device_id = device_id
+        # prefix of every adb command targeting this device
+        self._adb_prefix: Tuple[str, ...] = (str(ADB_PATH), "-s", device_id) if device_id else (str(ADB_PATH),)
 
         # These will be populated on as-needed basis and cached through the associated @property's
-        self._model: Optional[str] = None
-        self._brand: Optional[str] = None
-        self._manufacturer: Optional[str] = None
+        self._system_properties: Dict[str, str] = {}
 
         self._name: Optional[str] = None
-        self._ext_storage = Device.override_ext_storage.get(self.model)
+        self._ext_storage: Optional[str] = None
         self._device_server_datetime_offset: Optional[datetime.timedelta] = None
         self._api_level: Optional[int] = None
+        self._prime_cache()
+        self._ext_storage = Device.override_ext_storage.get(self.model) or self._ext_storage
+
+    def _prime_cache(self) -> None:
+        """
+        Populate the cached device attributes through a single adb round-trip rather than one per attribute.
+        Any attribute not determined here is left to be queried on-demand through its associated @property
+        """
+        queries = ("getprop ro.product.brand",
+                   "getprop ro.product.model",
+                   "getprop ro.product.manufacturer",
+                   "getprop ro.build.version.sdk",
+                   "echo $EXTERNAL_STORAGE",
+                   "echo $EPOCHREALTIME")
+        try:
+            completed = self.execute_remote_cmd("shell", f"; echo {self.QUERY_SEPARATOR}; ".join(queries),
+                                                stdout=subprocess.PIPE)
+        except Exception as e:
+            log.debug(f"Unable to query device attributes in batch; will query on-demand [{str(e)}]")
+            return
+        values = [value.strip() for value in completed.stdout.split(self.QUERY_SEPARATOR)]
+        if len(values) != len(queries):
+            log.debug("Unexpected output querying device attributes in batch; will query on-demand")
+            return
+        brand, model, manufacturer, api_level, ext_storage, epoch_time = values
+        for prop_name, value in (("ro.product.brand", brand),
+                                 ("ro.product.model", model),
+                                 ("ro.product.manufacturer", manufacturer)):
+            if value:
+                self._system_properties[prop_name] = value
+        self._api_level = int(api_level) if api_level.isdigit() else None
+        self._ext_storage = ext_storage or None
+        if self.EPOCH_TIME_PATTERN.match(epoch_time):
+            device_datetime = datetime.datetime.fromtimestamp(float(epoch_time))
+            self._device_server_datetime_offset = datetime.datetime.now() - device_datetime
 
     def _activity_stack_top(self, pkg_filter: Callable[[str], bool] = lambda x: True) -> Optional[str]:
         """
@@ -338,12 +412,15 @@ class Device:
     def _determine_system_property(self, prop_name: str) -> str:
         """
         :param prop_name: property to fetch
-        :return: requested property or "UNKNOWN" if not present on device
-        """
-        prop = self.get_system_property(prop_name)
-        if not prop:
-            log.error("Unable to get brand of device from system properties. Setting to \"UNKNOWN\".")
-            prop = "UNKNOWN"
+        :return: requested property or "UNKNOWN" if not present on device (cached after first lookup)
+        """
+        prop = self._system_properties.get(prop_name)
+        if prop is None:
+            prop = self.get_system_property(prop_name)
+            if not prop:
+                log.error(f"Unable to get {prop_name} of device from system properties. Setting to \"UNKNOWN\".")
+                prop = "UNKNOWN"
+            self._system_properties[prop_name] = prop
         return prop
 
     def _verify_install(self, application_path: str, package: str, verify_screenshot_dir: Optional[str] = None) -> None:
@@ -397,9 +474,7 @@ class Device:
         """
         :return: the brand of the device as provided in its system properties, or "UNKNOWN" if indeterminable
         """
-        if not self._brand:
-            self._brand = self._determine_system_property("ro.product.brand")
-        return self._brand
+        return self._determine_system_property("ro.product.brand")
 
     @property
     def device_server_datetime_offset(self) -> datetime.timedelta:
@@ -419,7 +494,7 @@ class Device:
             # noinspection SpellCheckingInspection
             completed = self.execute_remote_cmd("shell", "echo", "$EPOCHREALTIME", stdout=subprocess.PIPE)
             for msg_ in completed.stdout.splitlines():
-                if re.search(r"^\d+\.\d+$", msg_):
+                if self.EPOCH_TIME_PATTERN.match(msg_):
                     device_datetime = datetime.datetime.fromtimestamp(float(msg_.strip()))
                     self._device_server_datetime_offset = datetime.datetime.now() - device_datetime
                     is_valid = True
@@ -465,18 +540,14 @@ class Device:
         """
         :return: the manufacturer of this device, or "UNKNOWN" if indeterminable
         """
-        if not self._manufacturer:
-            self._manufacturer = self._determine_system_property("ro.product.manufacturer")
-        return self._manufacturer
+        return self._determine_system_property("ro.product.manufacturer")
 
     @property
     def model(self) -> str:
         """
         :return: the model of this device, or "UNKNOWN" if indeterminable
         """
-        if not self._model:
-            self._model = self._determine_system_property("ro.product.model")
-        return self._model
+        return self._determine_system_property("ro.product.model")
 
     ###############
     # RAW COMMAND EXECUTION ON DEVICE
@@ -489,10 +560,7 @@ class Device:
         :param args: args to the adb command
         :return: the adb command that executes the given arguments on the remote device from this host
         """
-        if self.device_id:
-            return (str(ADB_PATH), "-s", self.device_id, *args)
-        else:
-            return (str(ADB_PATH), *args)
+        return (*self._adb_prefix, *args)
 
     async def execute_remote_cmd_async(self, *args: str,
                                        timeout: Optional[float] = None,
@@ -505,21 +573,19 @@ class Device:
         """
         proc = await asyncio.subprocess.create_subprocess_exec(*self._formulate_adb_cmd(*args),
                                                                stdout=stdout, stderr=stderr)
+        # read output while waiting on the process (rather than after), lest it block on a full pipe
         if timeout:
-            await asyncio.wait_for(proc.wait(), timeout=timeout)
+            out_bytes, err_bytes = await asyncio.wait_for(proc.communicate(), timeout=timeout)
         else:
-            await proc.wait()
-        stdout, stderr = await proc.communicate()
-        if isinstance(stdout, bytes):
-            stdout = stdout.decode('utf-8')
-        if isinstance(stderr, bytes):
-            stderr = stderr.decode('utf-8')
+            out_bytes, err_bytes = await proc.communicate()
+        out = out_bytes.decode('utf-8', errors='ignore') if out_bytes is not None else None
+        err = err_bytes.decode('utf-8', errors='ignore') if err_bytes is not None else None
         if fail_on_error_code(proc.returncode):
-            msg = '\n'.join([stdout or "", stderr or ""])
+            msg = '\n'.join([out or "", err or ""])
             with suppress(Exception):
                 proc.kill()
             raise self.CommandExecutionFailure(proc.returncode, f"Failed to execute cmd: {msg or 'no message'}")
-        return proc.returncode, stdout, stderr
+        return proc.returncode, out, err
 
     def execute_remote_cmd(self, *args: str,
                            timeout: Optional[float] = None,
@@ -543,8 +609,9 @@ class Device:
                 """
         # protected method: OK to access by subclasses
         timeout = timeout or Device.TIMEOUT_ADB_CMD
-        log.debug(f"Executing remote command: {self._formulate_adb_cmd(*args)} with timeout {timeout}")
-        completed = subprocess.run(self._formulate_adb_cmd(*args),
+        cmd = self._formulate_adb_cmd(*args)
+        log.debug(f"Executing remote command: {cmd} with timeout {timeout}")
+        completed = subprocess.run(cmd,
                                    timeout=timeout,
                                    stderr=stderr or subprocess.DEVNULL,
                                    stdout=stdout or subprocess.DEVNULL,
@@ -569,7 +636,7 @@ class Device:
         :return: subprocess.Open
         """
         # protected method: OK to access by subclasses
-        args = (str(ADB_PATH), "-s", self.device_id, *args)
+        args = self._formulate_adb_cmd(*args)
         log.debug(f"Executing: {' '.join(args)} in background")
         if 'encoding' not in kwargs:
             kwargs['encoding'] = 'utf-8'
@@ -614,8 +681,15 @@ class Device:
         :return: Best estimate of device's current datetime.
            If device's original datetime could not be computed, the server's datetime is returned.
         """
-        current_device_time = datetime.datetime.utcnow() - self.device_server_datetime_offset
-        return current_device_time
+        # naive UTC datetime, as before, but without the deprecated utcnow()
+        return datetime.datetime.fromtimestamp(self.get_device_epoch(), datetime.timezone.utc).replace(tzinfo=None)
+
+    def get_device_epoch(self) -> float:
+        """
+        :return: Best estimate of device's current time as seconds since the epoch, for clients that do not need a
+           datetime. If device's original datetime could not be computed, the server's time is returned.
+        """
+        return time.time() - self.device_server_datetime_offset.total_seconds()
 
     def get_device_setting(self, namespace: str, key: str, verbose: bool = True) -> Optional[str]:
         """
@@ -656,17 +730,13 @@ class Device:
         """
         :return: device's current locale setting, or None if undetermined
         """
+        lang, country, locale, product_locale = self._get_system_properties(
+            'persist.sys.language', 'persist.sys.country', 'persist.sys.locale', 'ro.product.locale')
         # try old way:
-        lang = self.get_system_property('persist.sys.language') or ""
-        lang = lang.strip()
-        country = self.get_system_property('persist.sys.country') or ""
-        country = country.strip()
-
         if lang and country:
-            device_locale: Optional[str] = '_'.join([lang.strip(), country.strip()])
+            device_locale: Optional[str] = '_'.join([lang, country])
         else:
-            device_locale = self.get_system_property('persist.sys.locale') or \
-                self.get_system_property("ro.product.locale") or None
+            device_locale = locale or product_locale or None
             device_locale = device_locale.replace('-', '_').strip() if device_locale else None
         return device_locale
 
@@ -714,10 +784,13 @@ class Device:
         version = None
         try:
             completed = self.execute_remote_cmd("shell", "dumpsys", "package", package, stdout=subprocess.PIPE)
-            for line in completed.stdout.splitlines():
-                if line and "versionName" in line and '=' in line:
-                    version = line.split('=')[1].strip()
-                    break
+            stdout: str = completed.stdout
+            # find the value directly rather than splitting the (sizable) dumpsys output into lines
+            start = stdout.find("versionName=")
+            if start >= 0:
+                start += len("versionName=")
+                end = stdout.find('\n', start)
+                version = stdout[start:end if end >= 0 else None].strip()
         except Exception as e:
             log.error(f"Unable to get version for package {package} [{str(e)}]")
         return version
@@ -738,6 +811,25 @@ class Device:
                 log.error(f"Unable to get system property {key} [{str(e)}]")
             return None
 
+    def _get_system_properties(self, *keys: str) -> List[Optional[str]]:
+        """
+        :param keys: the keys of the properties to be retrieved, all in a single round-trip to the device
+
+        :return: the (stripped) properties from the device associated with the given keys, in order, or all None
+           if they could not be retrieved
+        """
+        try:
+            completed = self.execute_remote_cmd(
+                "shell", f"; echo {self.QUERY_SEPARATOR}; ".join(f"getprop {key}" for key in keys),
+                stdout=subprocess.PIPE)
+            values: List[Optional[str]] = [value.strip() for value in completed.stdout.split(self.QUERY_SEPARATOR)]
+            if len(values) == len(keys):
+                return values
+            log.error(f"Unexpected output getting system properties {keys}")
+        except Exception as e:
+            log.error(f"Unable to get system properties {keys} [{str(e)}]")
+        return [None] * len(keys)
+
     def set_device_setting(self, namespace: str, key: str, value: str) -> Optional[str]:
         """
         Change a setting of the device
@@ -769,10 +861,11 @@ class Device:
         :param value: value to set to
         :return: previous value, in case client wishes to restore at some point
         """
-        previous_value = self.get_system_property(key)
         # noinspection SpellCheckingInspection
-        self.execute_remote_cmd("shell", "setprop", key, value)
-        return previous_value
+        # read the previous value and set the new one in a single round trip to the device
+        completed = self.execute_remote_cmd("shell", f"getprop {key}; setprop {key} {value}", stdout=subprocess.PIPE)
+        previous_value: str = completed.stdout
+        return previous_value.rstrip()
 
     ###################
     # Device listings of installed apps/activities
@@ -832,11 +925,7 @@ class Device:
         """
         :return: list of all packages installed on device
         """
-        items = []
-        for item in self.list("package"):
-            if "package" in item:
-                items.append(item.replace("package:", '').strip())
-        return items
+        return [item[len("package:"):].strip() for item in self.list("package") if item.startswith("package:")]
 
     async def iterate_installed_packages(self, timeout=2.0) -> AsyncIterator[str]:
         """
@@ -9,9 +9,9 @@ from subprocess import Popen
 from types import TracebackType
 
 from contextlib import suppress
-from typing import Dict, Tuple, Optional, TextIO, Type
+from typing import Optional, TextIO, Type
 
-from .parsing import LineParser
+from .parsing import LogcatTagDemuxer  # noqa: F401
 from .device import Device, RemoteDeviceBased
 
 log = logging.getLogger(__file__)
@@ -131,44 +131,3 @@ class DeviceLog(RemoteDeviceBased):
         :return: context manager for capturing output to specified file
         """
         return self.LogCapture(self.device, output_path=output_path)
-
-
-# noinspection SpellCheckingInspection
-class LogcatTagDemuxer(LineParser):
-    """
-    Concrete LineParser that processes lines of output from logcat filtered on a set of tags and demuxes those lines
-    based on a specific handler for each tag
-    """
-
-    def __init__(self, handlers: Dict[str, Tuple[str, LineParser]]):
-        """
-        :param handlers: dictionary of tuples of (logcat priority, handler)
-        """
-        # remove any spec on priority from tags:
-        super().__init__()
-        self._handlers = {tag: handlers[tag][1] for tag in handlers}
-
-    def parse_line(self, line: str) -> None:
-        """
-        farm each incoming line to associated handler based on adb tag
-        :param line: line to be parsed
-        """
-        if not self._handlers:
-            return
-        if line.startswith("-----"):
-            # ignore, these are startup output not actual logcat output from device
-            return
-        try:
-            # extract basic tag from line of logcat:
-            tag = line.split('(', 2)[0]
-            if not len(tag) > 2 and tag[1] == '/':
-                log.debug("Invalid tag in logcat output: %s" % line)
-                return
-            tag = tag[2:]
-            if tag not in self._handlers:
-                log.error("Unrecognized tag!? %s" % tag)
-                return
-            # demux and handle through the proper handler
-            self._handlers[tag].parse_line(line)
-        except ValueError:
-            log.error("Unexpected logcat line format: %s" % line)
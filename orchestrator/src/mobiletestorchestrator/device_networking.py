@@ -1,7 +1,7 @@
 import asyncio
 import subprocess
 import time
-from typing import Optional
+from typing import List, Optional
 
 from mobiletestorchestrator.device import Device, RemoteDeviceBased, log
 
@@ -98,18 +98,18 @@ class AsyncDeviceConnectivity(RemoteDeviceBased):
         :return: 0 on success, number of failed packets otherwise
         """
         try:
-            stdout = ""
+            output: List[str] = []
             async with self.device.monitor_remote_cmd("exec-out", "ping", "-c", str(count), domain) as proc:
-                async for msg in proc.output(unresponsive_timeout=Device.TIMEOUT_ADB_CMD):
-                    stdout += msg + '\n'
-                    if "64 bytes" in str(msg):
-                        count -= 1
+                async for lines in proc.output_batches(unresponsive_timeout=Device.TIMEOUT_ADB_CMD):
+                    output += lines
+                    count -= sum(1 for msg in lines if "64 bytes" in msg)
                     if count <= 0:
+                        # no need to wait on remaining output;  process is stopped on exit of context
                         break
             if count > 0:
-                log.error("Output from ping was: \n%s", stdout)
-            return count
-        except asyncio.TimeoutExpired:
+                log.error("Output from ping was: \n%s", "".join(output))
+            return max(count, 0)
+        except asyncio.TimeoutError:
             log.error("ping is hanging and not yielding any results. Returning error code.")
             return -1
 
@@ -15,7 +15,7 @@ from contextlib import asynccontextmanager, suppress
 from typing import Any, AsyncGenerator, Callable, Generic, List, Optional, TypeVar, Type, Union
 
 from mobiletestorchestrator import ADB_PATH
-from mobiletestorchestrator.device import Device
+from mobiletestorchestrator.device import Device, ONLINE_DEVICE_PATTERN
 from mobiletestorchestrator.emulators import Emulator, EmulatorBundleConfiguration
 
 It = TypeVar('It')
@@ -87,14 +87,9 @@ class BaseDevicePool(ABC):
     @classmethod
     def _list_devices(cls, filt: Callable[[str], bool]) -> List[str]:
         cmd = [str(ADB_PATH), "devices"]
-        completed = subprocess.run(" ".join(cmd), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
-        device_ids = []
-        for line in completed.stdout.decode('utf-8').splitlines():
-            if line.strip().endswith("device"):
-                device_id = line.split()[0]
-                if filt(device_id):
-                    device_ids.append(device_id)
-        return device_ids
+        completed = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        return [match.group(1) for match in ONLINE_DEVICE_PATTERN.finditer(completed.stdout.decode('utf-8'))
+                if filt(match.group(1))]
 
     @classmethod
     async def discover(cls: Type[Pool], filt: Callable[[str], bool] = lambda x: True) -> Pool:
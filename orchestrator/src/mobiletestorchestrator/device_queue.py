@@ -5,7 +5,7 @@ from asyncio.queues import Queue
 from typing import Callable, AsyncGenerator
 
 from mobiletestorchestrator import ADB_PATH
-from mobiletestorchestrator.device import Device
+from mobiletestorchestrator.device import Device, ONLINE_DEVICE_PATTERN
 
 
 class BaseDeviceQueue(ABC):
@@ -19,18 +19,12 @@ class BaseDeviceQueue(ABC):
     def empty(self) -> bool:
         return self._q.empty()
 
-    @staticmethod
-    def _list_devices(pkg_filter: Callable[[str], bool]):
+    @classmethod
+    def _list_devices(cls, pkg_filter: Callable[[str], bool]):
         cmd = [str(ADB_PATH), "devices"]
-        completed = subprocess.run(" ".join(cmd), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
-        device_ids = []
-        for line in completed.stdout.splitlines():
-            line = line.decode('utf-8').strip()
-            if line.strip().endswith("device"):
-                device_id = line.split()[0]
-                if pkg_filter(device_id):
-                    device_ids.append(device_id)
-        return device_ids
+        completed = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        return [match.group(1) for match in ONLINE_DEVICE_PATTERN.finditer(completed.stdout.decode('utf-8'))
+                if pkg_filter(match.group(1))]
 
     @classmethod
     async def discover(cls, pkg_filter: Callable[[str], bool] = lambda x: True) -> "BaseDeviceQueue":
@@ -22,6 +22,46 @@ __all__ = ["EmulatorBundleConfiguration", "Emulator"]
 log = logging.getLogger(str(Path(__file__).stem))
 
 
+async def _wait_for_boot_completed(device: Device, max_poll_interval: float = 1.0) -> None:
+    """
+    Wait until the given (online) device reports that it has completed boot and its boot animation has stopped,
+    polling frequently at first and backing off to max_poll_interval, so as not to oversleep once boot completes.
+    Polling is done through a single long-lived adb shell (respawned should it drop), rather than launching a new
+    adb process for each poll
+
+    :param device: device to wait on
+    :param max_poll_interval: maximum time in seconds between polls
+    """
+    start = time.time()
+    poll_interval = 0.1
+    loop = asyncio.get_running_loop()
+    shell: Optional["subprocess.Popen[str]"] = None
+    try:
+        while True:
+            if shell is None or shell.poll() is not None:
+                shell = device.execute_remote_cmd_background("shell", stdin=subprocess.PIPE, bufsize=1)
+            assert shell.stdin is not None and shell.stdout is not None
+            with suppress(OSError):
+                # boot animation stopping is a stricter readiness signal than boot_completed alone;  query both at once
+                shell.stdin.write("getprop sys.boot_completed; getprop init.svc.bootanim\n")
+                shell.stdin.flush()
+                booted = (await loop.run_in_executor(None, shell.stdout.readline)).strip()
+                bootanim = (await loop.run_in_executor(None, shell.stdout.readline)).strip()
+                if booted == "1" and bootanim in ("stopped", ""):
+                    break
+            log.debug(f">>> {device.device_id} [{time.time() - start}] Booted?: False")
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, max_poll_interval)
+    finally:
+        if shell is not None:
+            # nothing of value left in the shell:  kill it outright and reap it off the event loop
+            with suppress(Exception):
+                shell.kill()
+            with suppress(Exception):
+                await loop.run_in_executor(None, shell.communicate)
+    log.debug(f">>> {device.device_id} [{time.time() - start}] Booted?: True")
+
+
 @dataclass
 class EmulatorBundleConfiguration:
     """Path to SDK (must contain platform-tools and emulator dirs)"""
@@ -98,13 +138,9 @@ class Emulator(Device):
                              stderr=subprocess.STDOUT,
                              stdout=subprocess.PIPE,
                              env=env)
-            booted = False
-            while await self.get_state(False) != Device.State.ONLINE:
-                await asyncio.sleep(1)
-
-            while not booted:
-                booted = self.get_system_property("sys.boot_completed") == "1"
+            while await self.get_state_async(False) != Device.State.ONLINE:
                 await asyncio.sleep(1)
+            await _wait_for_boot_completed(self)
 
         await asyncio.wait_for(wait_for_boot(), config.boot_timeout)
 
@@ -162,12 +198,8 @@ class Emulator(Device):
                 if proc.poll() is not None:
                     stdout, _ = proc.communicate()
                     raise Emulator.FailedBootError(port, stdout.decode('utf-8'))
-                start = time.time()
-                while not booted:
-                    booted = device.get_system_property("sys.boot_completed", ) == "1"
-                    await asyncio.sleep(1)
-                    duration = time.time() - start
-                    log.debug(f">>> {device.device_id} [{duration}] Booted?: {booted}")
+                await _wait_for_boot_completed(device)
+                booted = True
 
             await asyncio.wait_for(wait_for_boot(), config.boot_timeout)
             Emulator._launches[device_id] = (avd, port, config, list(args), environ)
@@ -308,7 +340,7 @@ class EmulatorQueue:
         :return: the queue for retrieving/relinquishing emulators
         """
         def entry_point(avd: str, config: EmulatorBundleConfiguration, queue: EmulatorQueue) -> None:
-            asyncio.get_event_loop().run_until_complete(queue.start_async(avd, config, *args))
+            asyncio.run(queue.start_async(avd, config, *args))
 
         queue = EmulatorQueue(count)
         queue._process = Process(target=entry_point, args=(avd, config, queue))
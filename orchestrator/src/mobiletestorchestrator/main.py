@@ -1,10 +1,8 @@
 import asyncio
-import sys
-
 import logging
 import os
 from types import TracebackType
-from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Type, Union, Any
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sized, Tuple, Type, Union, Any
 
 from . import _async_iter_adapter
 from .worker import TestSuite
@@ -18,11 +16,6 @@ from .worker import Worker
 log = logging.getLogger(__name__)
 
 
-if sys.platform == 'win32':
-    loop = asyncio.ProactorEventLoop()
-    asyncio.set_event_loop(loop)
-
-
 class AndroidTestOrchestrator:
     """
     Class for orchestrating interactions with a device or emulator during execution of a test or suite of tests.
@@ -89,7 +82,7 @@ class AndroidTestOrchestrator:
     ...          max_test_suite_time = 1*60*60,  # one hour
     ...          run_under_orchestration= False) as orchestrator:
     ...        test_suite = TestSuite('test_suite1', {"package": "com.some.test.package"})
-    ...        test_plan = iter([test_suite])
+    ...        test_plan = (test_suite,)
     ...        orchestrator.add_test_listener(Listener())
     ...        await orchestrator.execute_test_plan(
     ...            test_setup=setup,
@@ -108,20 +101,24 @@ class AndroidTestOrchestrator:
     class WrappedAsyncIterator(AsyncIterator[TestSuite]):
         """
         Allows orchestrator class to monitor an underlying AsyncIterator to tell whether it is
-        exhausted
+        exhausted.  Must be created within a running event loop;  concurrent clients (workers) are
+        serialized so that the underlying iterator is never advanced re-entrantly.  A synchronous, non-sequence
+        iterable is advanced from the loop's default executor, prefetching one item ahead
         """
-        def __init__(self, base_iterator: Union[Iterator[TestSuite], AsyncIterator[TestSuite]]):
-            self._base_iterator = _async_iter_adapter(base_iterator) if isinstance(base_iterator, Iterator) else \
-                base_iterator
+        def __init__(self, base_iterator: Union[Iterable[TestSuite], AsyncIterator[TestSuite]]):
+            self._base_iterator = _async_iter_adapter(base_iterator) if isinstance(base_iterator, Iterable) \
+                else base_iterator
             self._exhausted = False
+            self._lock = asyncio.Lock()
 
         async def __anext__(self) -> TestSuite:
-            try:
-                item = await self._base_iterator.__anext__()
-                return item
-            except (StopAsyncIteration, StopIteration):
-                self._exhausted = True
-                raise
+            async with self._lock:
+                try:
+                    item = await self._base_iterator.__anext__()
+                    return item
+                except (StopAsyncIteration, StopIteration):
+                    self._exhausted = True
+                    raise
 
         @property
         def exhausted(self) -> bool:
@@ -159,7 +156,7 @@ class AndroidTestOrchestrator:
         self._tag_monitors: Dict[str, Tuple[str, LineParser]] = {}
         self._run_listeners: List[TestExecutionListener] = []
         self._run_under_orchestration = run_under_orchestration
-        self._in_execution = False
+        self._executions_in_progress = 0
 
     async def __aenter__(self) -> "AndroidTestOrchestrator":
         return self
@@ -192,7 +189,7 @@ class AndroidTestOrchestrator:
            could happen is if a user defined task attempts to add additional tags to monitor
         :raises ValueError: if priority is invalid or is tag is already being monitored
         """
-        if self._in_execution:
+        if self._executions_in_progress:
             raise Exception("Cannot add tag to monitor from logcat while a test suite is in progress")
         if priority not in ["I", "D", "E", "*"]:
             raise ValueError("Priority must be ont of 'I', 'D', 'E' or '*'")
@@ -203,14 +200,16 @@ class AndroidTestOrchestrator:
     async def run(self,
                   device: Device,
                   test_setup: EspressoTestSetup,
-                  test_plan: Union[Iterator[TestSuite], AsyncIterator[TestSuite]]) -> None:
+                  test_plan: Union[Iterable[TestSuite], AsyncIterator[TestSuite]]) -> None:
         """
         Run a collection test suites against a single device, pulling each test suite from an externally supplied
         iterator
 
         :param test_setup: information to prepare device for test execution
         :param device: device to run against
-        :param test_plan: iterator of test suites to pull from
+        :param test_plan: iterator of test suites to pull from;  unless a sequence (e.g. tuple or list) or an async
+           iterator, it is advanced from a worker thread, one item ahead of use, so it must be thread-safe and
+           free of side effects that depend on when items are pulled
         """
         test_plan = self.WrappedAsyncIterator(test_plan)
         # monitor requested logcat tags
@@ -219,11 +218,16 @@ class AndroidTestOrchestrator:
                         test_setup=test_setup,
                         artifact_dir=self._artifact_dir,
                         listeners=self._run_listeners)
-        await worker.run(
-            under_orchestration=self._run_under_orchestration,
-            test_timeout=self._test_timeout,
-            monitor_tags=self._tag_monitors
-        )
+        # tags to monitor are fixed from here on (see add_logcat_monitor)
+        self._executions_in_progress += 1
+        try:
+            await worker.run(
+                under_orchestration=self._run_under_orchestration,
+                test_timeout=self._test_timeout,
+                monitor_tags=self._tag_monitors
+            )
+        finally:
+            self._executions_in_progress -= 1
 
     async def run_single_test_suite(self,
                                     test_setup: EspressoTestSetup,
@@ -236,7 +240,7 @@ class AndroidTestOrchestrator:
         :param device: which device to run against
         :param test_suite: the test suite to run
         """
-        await self.run(test_setup=test_setup, device=device, test_plan=iter([test_suite]))
+        await self.run(test_setup=test_setup, device=device, test_plan=(test_suite,))
 
     async def _do_work(self, devices: AsyncDevicePool,
                        test_plan: "AndroidTestOrchestrator.WrappedAsyncIterator",
@@ -273,33 +277,50 @@ class AndroidTestOrchestrator:
     async def execute_test_plan(self,
                                 test_setup: EspressoTestSetup,
                                 devices: AsyncDevicePool,
-                                test_plan: Union[Iterator[TestSuite], AsyncIterator[TestSuite]]) -> None:
+                                test_plan: Union[Iterable[TestSuite], AsyncIterator[TestSuite]]) -> None:
         """
         Execute the given test plan, distributing test execution across the given test application instances
 
         :param test_setup: used to set up the test apk, target apk and such
         :param devices: queue to reserve devices to run on
-        :param test_plan: plan of test runs to execute
+        :param test_plan: plan of test runs to execute;  if its size is known up front (e.g. a tuple or list), no
+           more workers (and therefore device reservations) are started than there are test suites to execute.
+           Any other (synchronous) iterable is advanced from a worker thread, one item ahead of use, so must be
+           thread-safe and free of side effects that depend on when items are pulled
         """
         # see comment on acquire() below
         start_gate = asyncio.Semaphore(0)
+        max_worker_count = self._max_device_count
+        if isinstance(test_plan, Sized):
+            max_worker_count = min(len(test_plan), max_worker_count if max_worker_count is not None else len(test_plan))
         test_plan_ = self.WrappedAsyncIterator(test_plan)
 
         async def run_loop() -> None:
             worker_tasks: List[asyncio.Task[Any]] = []
-            while not test_plan_.exhausted and \
-                    (self._max_device_count is None or len(worker_tasks) < self._max_device_count):
-                # call worker to start processing and running tests from the test plan
-                # (completes when all tests ar exhausted)
-                task = asyncio.create_task(self._do_work(devices, test_plan_, test_setup, start_gate))
-                worker_tasks.append(task)
-                # synchronize, to ensure we don't spin our wheels creating gobs of workers.  this waits on the
-                # newly created worker to grab a device before creating the next one
-                await start_gate.acquire()
-            results, _ = await asyncio.wait(worker_tasks, return_when=asyncio.ALL_COMPLETED)
-            [r.result() for r in results]  # will raise any exception caught during task execution
-
-        await asyncio.wait_for(run_loop(), timeout=self._instrumentation_timeout)
+            try:
+                while not test_plan_.exhausted and \
+                        (max_worker_count is None or len(worker_tasks) < max_worker_count):
+                    # call worker to start processing and running tests from the test plan
+                    # (completes when all tests ar exhausted)
+                    task = asyncio.create_task(self._do_work(devices, test_plan_, test_setup, start_gate))
+                    worker_tasks.append(task)
+                    # synchronize, to ensure we don't spin our wheels creating gobs of workers.  this waits on the
+                    # newly created worker to grab a device before creating the next one
+                    await start_gate.acquire()
+                results = await asyncio.gather(*worker_tasks, return_exceptions=True)
+            finally:
+                # no worker may outlive this loop (e.g. on timeout of the overall test plan);  no-op for those done
+                for task in worker_tasks:
+                    task.cancel()
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result  # raise any exception caught during task execution
+
+        try:
+            await asyncio.wait_for(run_loop(), timeout=self._instrumentation_timeout)
+        finally:
+            # all devices are set up by now;  release local resources used only for setup
+            test_setup.cleanup()
         log.info("Test execution completed")
 
     async def execute_single_test_suite(self,
@@ -316,14 +337,19 @@ class AndroidTestOrchestrator:
         """
         await self.execute_test_plan(test_setup,
                                      devices,
-                                     test_plan=iter([test_suite]))
+                                     test_plan=(test_suite,))
 
     async def execute_test_plan_sole_device(self,
                                             test_setup: EspressoTestSetup,
                                             device: Device,
-                                            test_plan: Union[Iterator[TestSuite], AsyncIterator[TestSuite]]) -> None:
+                                            test_plan: Union[Iterable[TestSuite], AsyncIterator[TestSuite]]) -> None:
         """
         execute test plan against a single device
+
+        :param test_setup: used to set up the test apk, target apk and such
+        :param device: device to run against
+        :param test_plan: plan of test runs to execute;  as for execute_test_plan, a synchronous iterable that is not
+           a sequence is advanced from a worker thread, one item ahead of use
         """
         queue = asyncio.Queue(1)
         await queue.put(device)
@@ -338,5 +364,5 @@ class AndroidTestOrchestrator:
         Execute test suite against a single device
         """
         await self.execute_test_plan_sole_device(test_setup=test_setup,
-                                                 test_plan=iter([test_suite]),
+                                                 test_plan=(test_suite,),
                                                  device=device)
@@ -8,9 +8,10 @@ the test status through the output of "adb instrument"  test status, and for dem
 are provided by this package.
 """
 import logging
+import re
 
 from abc import abstractmethod, ABC
-from typing import List, Optional, Any, Dict, Tuple
+from typing import Iterable, List, Optional, Any, Dict, Tuple
 
 from .reporting import TestExecutionListener
 from .timing import StopWatch
@@ -31,6 +32,17 @@ class LineParser(ABC):
         :return:
         """
 
+    def parse_lines(self, lines: Iterable[str]) -> None:
+        """
+        Parse the given batch of lines, in order; equivalent to calling parse_line on each but avoids
+        the per-line overhead of dispatching from the caller
+
+        :param lines: text of lines to parse
+        """
+        parse_line = self.parse_line
+        for line in lines:
+            parse_line(line)
+
 
 class InstrumentationOutputParser(LineParser):
     """
@@ -87,6 +99,7 @@ class InstrumentationOutputParser(LineParser):
     CODE_ASSUMPTION_VIOLATION = -4
 
     # line control prefix
+    PREFIX_INSTRUMENTATION = "INSTRUMENTATION_"
     PREFIX_STATUS = "INSTRUMENTATION_STATUS: "
     PREFIX_STATUS_CODE = "INSTRUMENTATION_STATUS_CODE: "
     PREFIX_FAILED = "INSTRUMENTATION_FAILED: "
@@ -126,6 +139,9 @@ class InstrumentationOutputParser(LineParser):
 
     class TestParsingResult:
         """Holds information about current test while parsing"""
+        # one of these is created per test status bundle;  slots avoid a per-instance __dict__
+        __slots__ = ("code", "test_name", "test_class", "num_tests", "stack_trace", "stream")
+
         def __init__(self) -> None:
             self.code: Optional[int] = None
             self.test_name: Optional[str] = None
@@ -140,7 +156,7 @@ class InstrumentationOutputParser(LineParser):
                     and self.test_class is not None)
 
         def __repr__(self) -> str:
-            return self.__class__.__name__ + str(self.__dict__)
+            return self.__class__.__name__ + str({name: getattr(self, name) for name in self.__slots__})
 
     class TestRunError(Exception):
         pass
@@ -169,7 +185,8 @@ class InstrumentationOutputParser(LineParser):
         self._test_run_time: float = 0
 
         self._include_instrumentation_output = include_instrumentation_output
-        self._instrumentation_text = ""
+        # raw output lines are collected and joined only when reported, rather than concatenated line by line
+        self._instrumentation_lines: List[str] = []
         self._test_run_failure_msgs: List[str] = []
 
     def __enter__(self) -> "InstrumentationOutputParser":
@@ -223,21 +240,23 @@ class InstrumentationOutputParser(LineParser):
         """
         if self._include_instrumentation_output:
             # collect raw output to send to client:
-            self._instrumentation_text += line + "\n"
-        if line.startswith(self.PREFIX_STATUS_CODE):
+            self._instrumentation_lines.append(line)
+        # most lines (e.g. stack traces, continuation of values) carry no instrumentation prefix at all; rule those
+        # out with a single check before trying each of the specific prefixes
+        is_instrumentation = line.startswith(self.PREFIX_INSTRUMENTATION)
+        if is_instrumentation and line.startswith(self.PREFIX_STATUS_CODE):
             self._finalize_current_key_value()
             self._in_result_key_value = False
             self._parse_status_code(line[len(self.PREFIX_STATUS_CODE):])
-        elif line.startswith(self.PREFIX_STATUS):
+        elif is_instrumentation and line.startswith(self.PREFIX_STATUS):
             self._finalize_current_key_value()
             self._in_result_key_value = False
             self._parse_key_value(line[len(self.PREFIX_STATUS):])
-        elif line.startswith(self.PREFIX_RESULT):
+        elif is_instrumentation and line.startswith(self.PREFIX_RESULT):
             self._finalize_current_key_value()
             self._in_result_key_value = True
             self._parse_key_value(line[len(self.PREFIX_RESULT):])
-        elif line.startswith(self.PREFIX_FAILED) \
-                or line.startswith(self.PREFIX_CODE):
+        elif is_instrumentation and (line.startswith(self.PREFIX_FAILED) or line.startswith(self.PREFIX_CODE)):
             self._finalize_current_key_value()
             self._in_result_key_value = False
             # at close() we'll report the error
@@ -259,6 +278,12 @@ class InstrumentationOutputParser(LineParser):
             elif line.strip():
                 log.debug("Unrecognized line: %s", line)
 
+    def _instrumentation_output(self) -> str:
+        """
+        :return: raw instrumentation output collected since the last reported result
+        """
+        return "".join(line + "\n" for line in self._instrumentation_lines)
+
     def _parse_status_code(self, line: str) -> None:
         """
         Parses content of line after "INSTRUMENTATION_STATUS_CODE: "
@@ -415,10 +440,11 @@ class InstrumentationOutputParser(LineParser):
                     reporter.test_failed(self._test_run_name, test_class, test_name,
                                          stack_trace=f"<<internal errro:unknown status code {test.code}")
                     reporter.test_ended(self._test_run_name, test_class, test_name)
+            instrumentation_output = self._instrumentation_output()
             for reporter in self._execution_listeners:
                 reporter.test_ended(self._test_run_name, test_class, test_name,
-                                    instrumentation_output=self._instrumentation_text)
-        self._instrumentation_text = ""
+                                    instrumentation_output=instrumentation_output)
+        self._instrumentation_lines = []
 
     def _report_test_run_failed(self, error_message: str) -> None:
         """
@@ -432,11 +458,12 @@ class InstrumentationOutputParser(LineParser):
             # got test start but not test stop - assume that test caused this and report as test failure
             stack_trace = "Test failed to run to completion. Reason: '%s'." \
                           " Check device logcat for details." % error_message
+            instrumentation_output = self._instrumentation_output()
             for reporter in self._execution_listeners:
                 reporter.test_failed(self._test_run_name, test_class, test_name, stack_trace)
                 reporter.test_ended(self._test_run_name, test_class, test_name,
-                                    instrumentation_output=self._instrumentation_text)
-        self._instrumentation_text = ""
+                                    instrumentation_output=instrumentation_output)
+        self._instrumentation_lines = []
         self._test_run_failure_msgs.append(error_message)
         self._reported_any_results = True
 
@@ -466,28 +493,25 @@ class LogcatTagDemuxer(LineParser):
         # remove any spec on priority from tags:
         super().__init__()
         self._handlers = {tag: handlers[tag][1] for tag in handlers}
+        # brief-format logcat lines are "<priority>/<tag padded with spaces>(<pid>): <msg>";  match all monitored
+        # tags in one pass rather than splitting each line
+        self._tag_pattern = re.compile(
+            r'^[VDIWEFS]/(' + '|'.join(re.escape(tag) for tag in self._handlers) + r')\s*\('
+        ) if self._handlers else None
 
     def parse_line(self, line: str) -> None:
         """
         farm each incoming line to associated handler based on adb tag
         :param line: line to be parsed
         """
-        if not self._handlers:
+        if self._tag_pattern is None:
             return
         if line.startswith("-----"):
             # ignore, these are startup output not actual logcat output from device
             return
-        try:
-            # extract basic tag from line of logcat:
-            tag = line.split('(', 2)[0]
-            if not len(tag) > 2 and tag[1] == '/':
-                log.debug("Invalid tag in logcat output: %s" % line)
-                return
-            tag = tag[2:]
-            if tag not in self._handlers:
-                log.error("Unrecognized tag!? %s" % tag)
-                return
-            # demux and handle through the proper handler
-            self._handlers[tag].parse_line(line)
-        except ValueError:
-            log.error("Unexpected logcat line format: %s" % line)
+        match = self._tag_pattern.match(line)
+        if match is None:
+            log.error("Unrecognized tag or unexpected logcat line format: %s" % line)
+            return
+        # demux and handle through the proper handler
+        self._handlers[match.group(1)].parse_line(line)
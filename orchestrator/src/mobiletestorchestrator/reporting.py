@@ -2,6 +2,7 @@
 Package that provides the constructs and the interface for reporting test status back to client
 """
 import datetime
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -9,16 +10,20 @@ from types import TracebackType
 from typing import Any, Dict, Optional, Type, List, Tuple
 
 
-class TestStatus(Enum):
+class TestStatus(str, Enum):
     PASSED = "PASSED"
     FAILED = "FAILED"
     IGNORED = "IGNORED"
     ASSUMPTION_FAILURE = "ASSUMPTION_FAILURE"
     INCOMPLETE = "INCOMPLETE"
 
-    def __repr__(self) -> str:
+    # render as the bare value;  the default for str-mixin enums differs across Python versions
+    def __str__(self) -> str:
         return self.value
 
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
 
 @dataclass(frozen=True)
 class TestSuite:
@@ -166,9 +171,18 @@ class TestResult(object):
         self.end_time: Optional[datetime.datetime] = None
         self.stack_trace: Optional[str] = None
         self.data: Dict[str, Any] = {}
+        # durations are measured on the monotonic clock, immune to wall-clock adjustments during a run
+        self._start_monotonic: Optional[float] = time.monotonic()
+        self._end_monotonic: Optional[float] = None
 
     @property
     def duration(self) -> float:
+        """
+        :return: duration of test in seconds, or 0.0 if test has not ended
+        """
+        if self._start_monotonic is not None and self._end_monotonic is not None:
+            return self._end_monotonic - self._start_monotonic
+        # e.g. end time set directly rather than through ended()
         if self.end_time is not None and self.start_time is not None:
             return (self.end_time - self.start_time).total_seconds()
         return 0.0
@@ -203,10 +217,12 @@ class TestResult(object):
         if self.status == TestStatus.INCOMPLETE:
             self.status = TestStatus.PASSED
         self.end_time = datetime.datetime.utcnow()
+        self._end_monotonic = time.monotonic()
         self.data = kwargs
 
     def __repr__(self) -> str:
-        return self.__class__.__name__ + str(self.__dict__)
+        return self.__class__.__name__ + str({key: value for key, value in self.__dict__.items()
+                                              if not key.startswith('_')})
 
 
 class TestResultContextManager:
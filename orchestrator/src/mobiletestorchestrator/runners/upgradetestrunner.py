@@ -11,7 +11,7 @@ from typing import Any, Callable, DefaultDict, List, Optional, Tuple
 
 from mobiletestorchestrator.device import Device
 from mobiletestorchestrator.application import Application
-from mobiletestorchestrator.reporting import TestRunResult
+from mobiletestorchestrator.reporting import TestExecutionListener
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
@@ -171,8 +171,7 @@ class UpgradeTest(object):
             raise UpgradeTestException(f"Uninstall upgrade package {package} failed")
 
     def _create_screenshots_dir(self) -> None:
-        if not os.path.exists(self.TEST_SCREENSHOTS_FOLDER):
-            os.makedirs(self.TEST_SCREENSHOTS_FOLDER)
+        os.makedirs(self.TEST_SCREENSHOTS_FOLDER, exist_ok=True)
 
     def _ensure_activity_in_foreground(self, package_name: str, timeout: int = 5) -> bool:
         count = 0
@@ -1,9 +1,15 @@
+import asyncio
 import os
 import logging
+import shutil
+import tarfile
+import tempfile
+import weakref
 from contextlib import suppress, asynccontextmanager
 from dataclasses import dataclass, field
+from pathlib import Path
 
-from typing import Dict, List, Optional, Tuple, FrozenSet, AsyncIterator, Any
+from typing import Dict, List, Optional, Set, Tuple, FrozenSet, AsyncIterator, Any
 from mobiletestorchestrator.device import Device
 from mobiletestorchestrator.device_networking import AsyncDeviceConnectivity
 from mobiletestorchestrator.device_storage import AsyncDeviceStorage
@@ -142,12 +148,15 @@ class DeviceSetup:
         #####
         # cleanup/restoration:
         #####
-        for (ns, key), setting in restoration_settings.items():  # type: ignore
-            with suppress(Exception):
-                device.set_device_setting(ns, key, setting or '\"\"')
-        for prop in restoration_properties:
-            with suppress(Exception):
-                device.set_system_property(prop, restoration_properties[prop] or '\"\"')
+        # restorations are independent of one another, so overlap their adb round-trips;  failures are ignored
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[loop.run_in_executor(None, device.set_device_setting, ns, key, setting or '\"\"')
+              for (ns, key), setting in restoration_settings.items()],
+            *[loop.run_in_executor(None, device.set_system_property, prop, value or '\"\"')
+              for prop, value in restoration_properties.items()],
+            return_exceptions=True
+        )
         for device_port, _ in self.reverse_forwarded_ports:
             try:
                 await dev_connectivity.remove_reverse_port_forward(device_port)
@@ -186,6 +195,13 @@ class EspressoTestSetup(DeviceSetup):
     uploadables: FrozenSet[str] = field(default_factory=frozenset)
     """Whether to grant all user permissions on start of tests"""
     grant_all_user_permissions: bool = True
+    """archives of uploadables (with finalizers removing their temp dirs), built once per root path and shared across
+    all devices this setup is applied to"""
+    _archives: Dict[str, Tuple["weakref.finalize[..., Any]", "asyncio.Future[Tuple[List[str], str]]"]] = \
+        field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # shell exit codes are only propagated back through adb (and tar is only guaranteed on device) from Android N on
+    MIN_API_LEVEL_ARCHIVE_UPLOAD = 24
 
     class Builder(DeviceSetup.Builder):
         """
@@ -270,21 +286,114 @@ class EspressoTestSetup(DeviceSetup):
                 except Device.CommandExecutionFailure:
                     log.error("Failed to uninstall app %s", app.package_name)
 
+    def cleanup(self) -> None:
+        """
+        Remove any local archives built for upload of test vectors.  Safe to call whenever no device is being
+        set up;  archives are simply rebuilt should this setup be applied again
+        """
+        while self._archives:
+            _, (remove_tmp_dir, _) = self._archives.popitem()
+            remove_tmp_dir()
+
+    async def _upload(self, dev: Device, root_path: str) -> List[str]:
+        """
+        Upload all files under the given root path to external storage on the device, mimicking the directory
+        structure below root path.  Files are bundled into a single archive pushed in one transfer where the device
+        supports it, falling back to pushing each file individually otherwise
+
+        :param dev: device to upload to
+        :param root_path: local root directory of files to upload
+        :return: list of remote paths of uploaded files
+        """
+        if dev.api_level and dev.api_level >= EspressoTestSetup.MIN_API_LEVEL_ARCHIVE_UPLOAD:
+            try:
+                relative_paths, archive_path = await self._archive(root_path)
+                if not relative_paths:
+                    return []
+                return await EspressoTestSetup._upload_archive(dev, archive_path, relative_paths)
+            except Exception as e:
+                log.warning(f"Failed to upload {root_path} as single archive; pushing files individually: {str(e)}")
+        relative_paths = await asyncio.get_running_loop().run_in_executor(None, EspressoTestSetup._list_files,
+                                                                          root_path)
+        return await EspressoTestSetup._upload_files(dev, root_path, relative_paths)
+
+    async def _archive(self, root_path: str) -> Tuple[List[str], str]:
+        """
+        :param root_path: local root directory of files to archive
+        :return: relative paths of the archived files and local path to the archive, built (off the event loop) on
+           first request and reused for every device thereafter
+        """
+        loop = asyncio.get_running_loop()
+        cached = self._archives.get(root_path)
+        if cached is not None and not cached[1].done() and cached[1].get_loop() is not loop:
+            # still being built under another event loop, so cannot be awaited from this one
+            cached = None
+        if cached is None:
+            tmp_dir = tempfile.mkdtemp()
+            # temp dir is removed on cleanup(), or at the latest once this setup is garbage collected (or on exit)
+            remove_tmp_dir = weakref.finalize(self, shutil.rmtree, tmp_dir, ignore_errors=True)
+            future = loop.run_in_executor(None, EspressoTestSetup._build_archive,
+                                          root_path, os.path.join(tmp_dir, "test_vectors.tar"))
+            cached = self._archives[root_path] = (remove_tmp_dir, future)
+        remove_tmp_dir, future = cached
+        try:
+            if future.done():
+                return future.result()
+            # shield the shared build so that one cancelled device worker does not cancel it for all others
+            return await asyncio.shield(future)
+        except BaseException:
+            # evict a failed (or cancelled) build so that the next device to be set up tries again
+            if future.done() and (future.cancelled() or future.exception() is not None):
+                if self._archives.get(root_path) is cached:
+                    del self._archives[root_path]
+                remove_tmp_dir()
+            raise
+
     @staticmethod
-    async def _upload(dev: Device, root_path: str) -> List[str]:
-        data_files_paths: List[str] = []
+    def _list_files(root_path: str) -> List[str]:
+        relative_paths: List[str] = []
+        for root, _, files in os.walk(root_path, topdown=True):
+            basedir = os.path.relpath(root, root_path)
+            relative_paths += [os.path.normpath(os.path.join(basedir, filename)) for filename in files]
+        return relative_paths
+
+    @staticmethod
+    def _build_archive(root_path: str, archive_path: str) -> Tuple[List[str], str]:
+        relative_paths = EspressoTestSetup._list_files(root_path)
+        with tarfile.open(archive_path, "w") as archive:
+            for relative_path in relative_paths:
+                archive.add(os.path.join(root_path, relative_path), arcname=Path(relative_path).as_posix())
+        return relative_paths, archive_path
+
+    @staticmethod
+    async def _upload_archive(dev: Device, archive_path: str, relative_paths: List[str]) -> List[str]:
         storage = AsyncDeviceStorage(dev)
         ext_storage = dev.external_storage_location
-        for root, _, files in os.walk(root_path, topdown=True):
-            if not files:
-                continue
-            basedir = os.path.relpath(root, root_path) + "/"
+        remote_archive_path = f"/data/local/tmp/test_vectors-{os.path.basename(os.path.dirname(archive_path))}.tar"
+        await storage.push(archive_path, remote_archive_path, timeout=5*60)
+        try:
+            await dev.execute_remote_cmd_async("shell", "tar", "-xf", remote_archive_path, "-C", ext_storage,
+                                               timeout=5*60)
+        finally:
             with suppress(Exception):
-                await storage.make_dir("/".join([ext_storage, basedir]))
-            for filename in files:
-                remote_location = "/".join([ext_storage, basedir, filename])
-                await storage.push(os.path.join(root, filename), remote_location, timeout=5*60)
-                data_files_paths.append(remote_location)
+                await storage.remove(remote_archive_path)
+        return ["/".join([ext_storage, Path(relative_path).as_posix()]) for relative_path in relative_paths]
+
+    @staticmethod
+    async def _upload_files(dev: Device, root_path: str, relative_paths: List[str]) -> List[str]:
+        data_files_paths: List[str] = []
+        storage = AsyncDeviceStorage(dev)
+        ext_storage = dev.external_storage_location
+        remote_dirs: Set[str] = set()
+        for relative_path in relative_paths:
+            remote_location = "/".join([ext_storage, Path(relative_path).as_posix()])
+            remote_dir = remote_location.rsplit("/", 1)[0]
+            if remote_dir not in remote_dirs:
+                with suppress(Exception):
+                    await storage.make_dir(remote_dir)
+                remote_dirs.add(remote_dir)
+            await storage.push(os.path.join(root_path, relative_path), remote_location, timeout=5*60)
+            data_files_paths.append(remote_location)
         return data_files_paths
 
     async def _install_all(self, dev: Device) -> List[AsyncApplication]:
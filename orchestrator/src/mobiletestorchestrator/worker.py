@@ -62,22 +62,23 @@ class Worker:
         self._logcat_proc: Optional[Device.Process] = None
         self._device = device
 
-    async def _process_logcat_tags(self, device: Device, monitor_tags: Dict[str, Tuple[str, LineParser]]) -> None:
+    async def _process_logcat_tags(self, device_log: DeviceLog, monitor_tags: Dict[str, Tuple[str, LineParser]]) -> None:
         """
         Process requested tags from logcat
 
-        :param device: remote device to process tags from
+        :param device_log: device log of the remote device to process tags from; shared with the
+           logcat capture so that no additional logcat configuration commands are issued
+        :param monitor_tags: tags mapped to (priority, listener) to be monitored
         """
         if not monitor_tags:
             return
         try:
             logcat_demuxer = LogcatTagDemuxer(monitor_tags)
-            device_log = DeviceLog(device)
             keys = ['%s:%s' % (k, v[0]) for k, v in monitor_tags.items()]
             async with device_log.logcat("-v", "brief", "-s", *keys) as proc:
                 self._logcat_proc = proc
-                async for line in proc.output():
-                    logcat_demuxer.parse_line(line)
+                async for lines in proc.output_batches():
+                    logcat_demuxer.parse_lines(lines)
                 # proc is stopped by test execution coroutine
 
         except Exception as e:
@@ -108,8 +109,8 @@ class Worker:
                     run_future = test_app.run_orchestrated(*test_args) if under_orchestration else \
                         await test_app.run(*test_args)
                     async with run_future as proc:
-                        async for line in proc.output(unresponsive_timeout=test_timeout):
-                            instrumentation_parser.parse_line(line)
+                        async for lines in proc.output_batches(unresponsive_timeout=test_timeout):
+                            instrumentation_parser.parse_lines(lines)
                         await proc.wait(timeout=test_timeout)
                 except Exception as e:
                     log.exception("Test run failed \n%s", str(e))
@@ -168,7 +169,7 @@ class Worker:
         logcat_output_path = os.path.join(self._artifact_dir, f"logcat-{self._device.device_id}.txt")
         logcat_task = None
         if monitor_tags:
-            logcat_task = asyncio.create_task(self._process_logcat_tags(self._device,
+            logcat_task = asyncio.create_task(self._process_logcat_tags(device_log,
                                                                         monitor_tags=monitor_tags))
         try:
             with device_log.capture_to_file(output_path=logcat_output_path):
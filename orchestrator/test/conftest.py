@@ -15,11 +15,11 @@ from typing import Optional
 
 from mobiletestorchestrator.application import Application, TestApplication, ServiceApplication, AsyncApplication
 from mobiletestorchestrator.device import Device
-from mobiletestorchestrator.device_pool import AsyncQueueAdapter, AsyncEmulatorPool
-from mobiletestorchestrator.emulators import EmulatorBundleConfiguration, Emulator
+from mobiletestorchestrator.device_pool import AsyncQueueAdapter, AsyncDevicePool, AsyncEmulatorPool
+from mobiletestorchestrator.emulators import EmulatorBundleConfiguration
 from mobiletestorchestrator.tooling.sdkmanager import SdkManager
 from . import support
-from .support import uninstall_apk, find_sdk
+from .support import uninstall_apk, uninstall_apks
 
 TAG_MTO_DEVICE_ID = "MTO_DEVICE_ID"
 try:
@@ -83,6 +83,10 @@ class DeviceManager:
         return count
 
 
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: slow-running test; deselect with -m \"not slow\" for quicker iteration")
+
+
 @pytest.fixture(scope='session')
 def device_pool_q():
     try:
@@ -127,7 +131,16 @@ class Thread(threading.Thread):
 
 
 @pytest.fixture(scope='session')
-def device_pool(device_pool_q):
+def device_pool(request):
+    if TAG_MTO_DEVICE_ID in os.environ:
+        # for debugging against local attached real device(s) or user invoked emulator(s):  serve the given
+        # (comma-separated) device ids for the whole session rather than launching emulators
+        q = queue.Queue()
+        for device_id in os.environ[TAG_MTO_DEVICE_ID].split(","):
+            q.put(Device(device_id.strip()))
+        yield AsyncDevicePool(AsyncQueueAdapter(q))
+        return
+    device_pool_q = request.getfixturevalue("device_pool_q")
     try:
         Thread(device_pool_q).start()
         yield pool_of_pools_q.get()
@@ -168,9 +181,7 @@ async def devices(device_pool: AsyncEmulatorPool, app_manager: "AppManager"):
     count = min(DeviceManager.count(), 2)
     async with device_pool.reserve_many(count, timeout=100) as devs:
         for dev in devs:
-            uninstall_apk(app_manager.app(), dev)
-            uninstall_apk(app_manager.test_app(), dev)
-            uninstall_apk(app_manager.service_app(), dev)
+            uninstall_apks(dev, app_manager.app(), app_manager.test_app(), app_manager.service_app())
         yield devs
 
 
@@ -180,9 +191,7 @@ async def device(device_pool: AsyncEmulatorPool, app_manager):
     return a single reserved device
     """
     async with device_pool.reserve(timeout=100) as device:
-        uninstall_apk(app_manager.app(), device)
-        uninstall_apk(app_manager.test_app(), device)
-        uninstall_apk(app_manager.service_app(), device)
+        uninstall_apks(device, app_manager.app(), app_manager.test_app(), app_manager.service_app())
         yield device
 
 
@@ -252,8 +261,7 @@ async def android_test_app(device,
     """
     :return: installed test app
     """
-    uninstall_apk(support_app, device)
-    uninstall_apk(support_test_app, device)
+    uninstall_apks(device, support_app, support_test_app)
     app_for_test = TestApplication.from_apk(support_test_app, device)
     support_app = Application.from_apk(support_app, device)
     yield app_for_test
@@ -270,8 +278,7 @@ async def android_test_app2(device2,
                             support_app: str,
                             support_test_app: str,
                             ):
-    uninstall_apk(support_app, device2)
-    uninstall_apk(support_test_app, device2)
+    uninstall_apks(device2, support_app, support_test_app)
     app_for_test = TestApplication.from_apk(support_test_app, device2)
     support_app = Application.from_apk(support_app, device2)
     yield app_for_test
@@ -317,11 +324,32 @@ def support_service_app(app_manager: AppManager):
 def fake_sdk(tmpdir_factory):
     tmpdir = tmpdir_factory.mktemp("sdk")
     os.makedirs(os.path.join(str(tmpdir), "platform-tools"))
-    with open(os.path.join(str(tmpdir), "platform-tools", "adb"), 'w'):
-        pass  # create a dummy file so that test of its existence as file passes
+    # create a dummy file so that test of its existence as file passes
+    Path(str(tmpdir), "platform-tools", "adb").touch()
     return str(tmpdir)
 
 
+@pytest.fixture(scope='session')
+def test_vectors_root(tmp_path_factory) -> Path:
+    """
+    :return: root directory holding a "test_vectors" directory with empty test vector files, built once per session
+    """
+    root = tmp_path_factory.mktemp("data_files")
+    tv_dir = root / "test_vectors"
+    tv_dir.mkdir()
+    (tv_dir / "tv-1.txt").touch()
+    (tv_dir / "tv-2.txt").touch()
+    return root
+
+
+@pytest.fixture(scope='session')
+def artifact_dir(tmp_path_factory) -> Path:
+    """
+    :return: session-wide artifact directory for tests that construct an orchestrator but never execute a test plan
+    """
+    return tmp_path_factory.mktemp("artifacts")
+
+
 @pytest.fixture
 def in_tmp_dir(tmp_path: Path) -> Path:
     cwd = os.getcwd()
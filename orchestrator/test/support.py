@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 # TODO: CAUTION: WE CANNOT USE asyncio.subprocess as we executein in a thread other than made and on unix-like systems, there
@@ -7,11 +8,11 @@ import subprocess
 import sys
 import platform
 from contextlib import suppress
+from functools import lru_cache
 from typing import Tuple, Dict, List
 
 from apk_bitminer.parsing import AXMLParser
 
-from mobiletestorchestrator.application import Application
 
 _BASE_DIR = os.path.join(os.path.dirname(__file__), "..", "..")
 _SRC_BASE_DIR = os.path.join(os.path.dirname(__file__), "..", )
@@ -19,6 +20,12 @@ _SRC_BASE_DIR = os.path.join(os.path.dirname(__file__), "..", )
 TEST_SUPPORT_APP_DIR = os.path.join(_BASE_DIR, "testsupportapps")
 TEST_SERVICE_APP_DIR = os.path.join(_BASE_DIR, "testservice")
 
+SUPPORT_APP_APK = os.path.join(TEST_SUPPORT_APP_DIR, "app", "build", "outputs", "apk", "debug", "app-debug.apk")
+SUPPORT_TEST_APP_APK = os.path.join(TEST_SUPPORT_APP_DIR, "app", "build", "outputs", "apk", "androidTest", "debug",
+                                    "app-debug-androidTest.apk")
+SUPPORT_SERVICE_APP_APK = os.path.join(TEST_SERVICE_APP_DIR, "app", "build", "outputs", "apk", "debug", "app-debug.apk")
+_SOURCES_STAMP_PATH = os.path.join(TEST_SUPPORT_APP_DIR, "app", "build", "mto-sources.sha256")
+
 RESOURCES_DIR = os.path.join(_SRC_BASE_DIR, "src", "mobiletestorchestrator", "resources")
 SETUP_PATH = os.path.join(_SRC_BASE_DIR, "setup.py")
 
@@ -59,25 +66,28 @@ def find_sdk():
     return android_sdk
 
 
-def gradle_build(targets_and_q: Dict[str, List[Tuple[str, str]]]):
+def gradle_build(targets_and_q: Dict[str, List[Tuple[str, str]]]) -> bool:
+    """
+    :return: whether all builds succeeded (failures only raise on non-Windows platforms)
+    """
     find_sdk()  # sets env vars
     processes = []
     for root_build_dir, target_and_q in targets_and_q.items():
         targets = [t for t, _ in target_and_q]
         gradle_path = os.path.join("gradlew")
+        kwargs = {}
         if sys.platform in ['win32', 'windows']:
-            cmd = [gradle_path+".bat", "--stacktrace", "--no-daemon"] + targets
-            shell = True
+            # invoke the wrapper script directly (no intermediary shell process) and without allocating a console
+            cmd = [os.path.join(root_build_dir, gradle_path+".bat"), "--stacktrace", "--no-daemon"] + targets
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
         else:
             cmd = [os.path.join(".", gradle_path)] + targets
-            shell = False
         log.info(f"Launching: {cmd} from {root_build_dir}")
         processes.append(subprocess.Popen(cmd,
                          cwd=root_build_dir,
-                         env=os.environ.copy(),
                          stdout=sys.stdout,
                          stderr=sys.stderr,
-                         shell=shell))
+                         **kwargs))
         if platform.system().lower() in ['win32', 'windows']:
             log.error(f"Building '{cmd}' serially")
             processes[-1].wait()
@@ -86,17 +96,42 @@ def gradle_build(targets_and_q: Dict[str, List[Tuple[str, str]]]):
         if process.returncode != 0 and platform.system().lower() not in ['win32', 'windows']:
             raise Exception("Failed to build at least one app")
     log.info(f"Built apks")
+    return all(process.returncode == 0 for process in processes)
+
+
+def _sources_hash(*src_dirs: str) -> str:
+    """
+    :param src_dirs: root directories of gradle projects
+    :return: hash over the paths and contents of all source files of the given projects (excluding build output)
+    """
+    digest = hashlib.sha256()
+    for src_dir in src_dirs:
+        for root, dirs, files in os.walk(src_dir):
+            dirs[:] = sorted(d for d in dirs if d not in ("build", ".gradle"))
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, _BASE_DIR).encode('utf-8'))
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
 
 
 def compile_all() -> Tuple[str, str, str]:
     """
-    compile support app and test app in the background and return the queues where they will be placed
+    compile support app and test app in the background and return the queues where they will be placed.
+    The gradle builds are skipped if the apks were already built from the current sources (by an earlier session)
 
     :return: tuple of queues that will hold the apps once built
     """
-    gradle_build(
+    apks = SUPPORT_APP_APK, SUPPORT_TEST_APP_APK, SUPPORT_SERVICE_APP_APK
+    sources_hash = _sources_hash(TEST_SUPPORT_APP_DIR, TEST_SERVICE_APP_DIR)
+    with suppress(FileNotFoundError):
+        with open(_SOURCES_STAMP_PATH) as f:
+            if f.read() == sources_hash and all(os.path.isfile(apk) for apk in apks):
+                log.info("Support apks are up to date; skipping build")
+                return apks
+    succeeded = gradle_build(
             {TEST_SUPPORT_APP_DIR: [
-                ("assemble", None),
                 ("assembleAndroidTest",  "support_app"),
                 ("assembleDebug", "support_test_app"),
             ],
@@ -105,13 +140,23 @@ def compile_all() -> Tuple[str, str, str]:
             ],
             },
         )
-    return os.path.join(TEST_SUPPORT_APP_DIR, "app", "build", "outputs", "apk", "debug", "app-debug.apk"), \
-        os.path.join(TEST_SUPPORT_APP_DIR, "app", "build", "outputs", "apk", "androidTest", "debug",
-                     "app-debug-androidTest.apk"), \
-        os.path.join(TEST_SERVICE_APP_DIR, "app", "build", "outputs", "apk", "debug", "app-debug.apk")
+    # only a fully successful build may be skipped next time
+    if succeeded:
+        with open(_SOURCES_STAMP_PATH, 'w') as f:
+            f.write(sources_hash)
+    return apks
 
 
 
+@lru_cache(maxsize=None)
+def _package_name(apk: str) -> str:
+    """
+    :param apk: path to apk
+    :return: package name of the given apk (parsed once per apk per session)
+    """
+    return AXMLParser.parse(apk).package_name
+
+
 def uninstall_apk(apk, device):
     """
     A little of a misnomer, as we don't actually uninstall an apk, however we can get the name of the
@@ -119,8 +164,22 @@ def uninstall_apk(apk, device):
     :param apk: apk to get package name from
     :param device: device to uninstall package from
     """
+    uninstall_apks(device, apk)
+
+
+def uninstall_apks(device, *apks):
+    """
+    Ensure the apps of all given apks are not installed on the device, with one query of installed packages and
+    (at most) one adb round trip to uninstall any that are present
+    :param device: device to uninstall packages from
+    :param apks: apks to get package names from
+    """
     with suppress(Exception):
-        Application(AXMLParser.parse(apk).package_name, device).uninstall()
+        installed = device.list_installed_packages()
+        # skip the (comparatively expensive) uninstall round trip for apps not there to begin with
+        package_names = [name for name in map(_package_name, apks) if name in installed]
+        if package_names:
+            device.execute_remote_cmd("shell", "; ".join(f"pm uninstall {name}" for name in package_names))
 
 
 def ensure_avd(android_sdk: str, avd: str):
@@ -124,8 +124,6 @@ class TestApplicationClass:
         assert test_app.package_name.endswith(".test")
         permission = "android.permission.WRITE_EXTERNAL_STORAGE"
         test_app.grant_permissions([permission])
-        await device.execute_remote_cmd_async("shell", "dumpsys", "package", test_app.package_name,
-                                              timeout=10, stdout=subprocess.PIPE)
         completed = device.execute_remote_cmd("shell", "dumpsys", "package", test_app.package_name,
                                               timeout=10, stdout=subprocess.PIPE)
         perms = []
@@ -56,7 +56,7 @@ class TestAndroidDevice:
         tmp_dir = tmp_path / "screenshots"
         tmp_dir.mkdir(exist_ok=True)
         path = os.path.join(str(tmp_dir), "created_test_screenshot.png")
-        open(path, 'w+b')  # create the file
+        Path(path).touch()  # create the file
         with pytest.raises(FileExistsError):
             device.take_screenshot(os.path.join(str(tmp_dir), path))
 
@@ -105,10 +105,6 @@ class TestAndroidDevice:
     @pytest.mark.asyncio
     async def test_install_uninstall_app(self, device: Device, support_app: str):
         uninstall_apk(support_app, device)
-        app = Application.from_apk(support_app, device)
-        app.uninstall()
-        assert app.package_name not in device.list_installed_packages()
-
         app = Application.from_apk(support_app, device)
         assert app.package_name in device.list_installed_packages()
         app.uninstall()
@@ -145,6 +141,7 @@ class TestAndroidDevice:
         """
         assert device.manufacturer == expected_device_info["manufacturer"]
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_get_device_datetime(self, device: Device):
         import time
@@ -157,6 +154,8 @@ class TestAndroidDevice:
         timediff = device.get_device_datetime() - dtime
         assert timediff.total_seconds() >= 0.99
         assert host_datetime_delta - host_delta < 0.05
+        device_epoch = device.get_device_datetime().replace(tzinfo=datetime.timezone.utc).timestamp()
+        assert abs(device.get_device_epoch() - device_epoch) < 0.05
 
     @pytest.mark.asyncio
     async def test_invalid_cmd_execution(self, device: Device):
@@ -170,6 +169,7 @@ class TestAndroidDevice:
         test_app = install_app(TestApplication, support_test_app)
         test_app.grant_permissions(["android.permission.WRITE_EXTERNAL_STORAGE"])
 
+    @pytest.mark.slow
     def test_start_stop_app(self, install_app, support_app):  # noqa
         app = install_app(Application, support_app)
 
@@ -241,3 +241,29 @@ class TestAndroidDevice:
                 async for _ in proc.output(unresponsive_timeout=0.01):
                     pass
 
+
+
+class TestDeviceProcess:
+
+    class FakeProcess:
+        """stands in for an asyncio.subprocess.Process, with output fed in controlled chunks"""
+
+        def __init__(self, *chunks: bytes):
+            self.stdout = asyncio.StreamReader()
+            for chunk in chunks:
+                self.stdout.feed_data(chunk)
+            self.stdout.feed_eof()
+
+    @pytest.mark.asyncio
+    async def test_output_batches(self):
+        # chunk size of 3 splits the output as: b"abc" | b"\nd\xc3" | b"\xa9\nx" | b"yz"
+        proc = Device.Process(self.FakeProcess("abc\ndé\nxyz".encode('utf-8')))
+        batches = [batch async for batch in proc.output_batches(chunk_size=3)]
+        # line split across reads, multi-byte character split across reads, trailing line without newline
+        assert batches == [["abc\n"], ["dé\n"], ["xyz"]]
+
+    @pytest.mark.asyncio
+    async def test_output_batches_multiple_lines_per_read(self):
+        proc = Device.Process(self.FakeProcess(b"line1\nline2\nline3\n"))
+        batches = [batch async for batch in proc.output_batches()]
+        assert batches == [["line1\n", "line2\n", "line3\n"]]
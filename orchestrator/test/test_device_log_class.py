@@ -1,13 +1,12 @@
-import asyncio
 import os
-import time
+import subprocess
 
 import pytest
 
 import mobiletestorchestrator
-from mobiletestorchestrator.application import ServiceApplication
 from mobiletestorchestrator.device import Device
 from mobiletestorchestrator.device_log import DeviceLog
+from mobiletestorchestrator.parsing import LineParser, LogcatTagDemuxer
 
 
 class TestDeviceLog:
@@ -20,64 +19,31 @@ class TestDeviceLog:
         log.set_logcat_buffer_size(DeviceLog.DEFAULT_LOGCAT_BUFFER_SIZE)
         assert log.logcat_buffer_size.upper() in ['5', '5MB']
 
-    @pytest.mark.asyncio
-    async def test_logcat_and_clear(self, device: Device, android_service_app: ServiceApplication):
-        output = []
-        # call here waits for emulator startup, allowing other fixtures to complete in parallel
+    def test_logcat_and_clear(self, device: Device):
         device_log = DeviceLog(device)
-        done_parsing = False
-
-        async def parse_logcat(counter, output):
-            nonlocal done_parsing
-            async with device_log.logcat("-v", "brief", "-s", "MTO-TEST") as proc:
-                async for line in proc.output(unresponsive_timeout=3):
-                    # makes easy to debug on circleci when emulator accel is not available
-                    if line.startswith("----"):
-                        continue
-                    output.append(line)
-                    if len(output) >= counter:
-                        break
-                await proc.stop(timeout=10, force=True)
-                await proc.wait(timeout=10)
-                done_parsing = True
-
-        async def populate_logcat(counter):
-            nonlocal done_parsing
-            for index in range(counter):
-                android_service_app.broadcast(".MTOBroadcastReceiver", "--es", "command", "old_line",
-                                          action="com.linkedin.mto.FOR_TEST_ONLY_SEND_CMD")
-                await asyncio.sleep(0.2)
-                if done_parsing:
-                    break
-
-        await asyncio.wait([parse_logcat(10, output), populate_logcat(20)],  timeout=120, return_when=asyncio.FIRST_EXCEPTION)
-        time.sleep(4)
+
+        def emit_lines(text: str, count: int = 20):
+            # generate deterministic log output in a single round trip, rather than waiting on the system to do so
+            device.execute_remote_cmd("shell", f"for i in $(seq {count}); do log -t MTO-TEST {text}_$i; done")
+
+        def dump_lines():
+            completed = device.execute_remote_cmd("logcat", "-d", "-v", "brief", "-s", "MTO-TEST",
+                                                  stdout=subprocess.PIPE)
+            return [line for line in completed.stdout.splitlines() if "MTO-TEST" in line]
+
+        emit_lines("old_line")
+        output_before = dump_lines()
+        assert any("old_line" in line for line in output_before)
         try:
             device_log.clear()
         except Device.CommandExecutionFailure:
             device_log.clear()  # intermittently android "fails to clear main log"
-        time.sleep(4)
-
-        for line in output:
-            if "old_line" in line:
-                print("WARNING: logcat not cleared as expected;  most likely due to logcat race condition over test error")
-                return
-        # capture more lines of output and make sure they don't match any in previous capture
-        output = []
-        done_parsing = False
-
-        # now emitting some new logs
-        async def populate_logcat2(counter):
-            nonlocal done_parsing
-            for index in range(counter):
-                android_service_app.broadcast(".MTOBroadcastReceiver", "--es", "command", "new_line",
-                                              action="com.linkedin.mto.FOR_TEST_ONLY_SEND_CMD")
-                await asyncio.sleep(0.2)
-                if done_parsing:
-                    break
-
-        await asyncio.wait([parse_logcat(1, output), populate_logcat2(20)],  timeout=120, return_when=asyncio.FIRST_EXCEPTION)
-        for line in output:
+
+        emit_lines("new_line")
+        output_after = dump_lines()
+        assert output_after
+        assert not set(output_after) & set(output_before)
+        for line in output_after:
             assert "old_line" not in line
             assert "new_line" in line
 
@@ -89,10 +55,32 @@ class TestDeviceLog:
             mobiletestorchestrator.ADB_PATH = os.path.join(fake_sdk, "platform-tools", "adb")
             device = Device("fakeid")
             tmpfile = os.path.join(str(tmp_dir), "somefile")
-            with open(tmpfile, 'w'):
-                pass
+            (tmp_dir / "somefile").touch()
             with pytest.raises(Exception) as exc_info:
                 DeviceLog.LogCapture(device, tmpfile)
             assert "Path %s already exists; will not overwrite" % tmpfile in str(exc_info.value)
         finally:
-            mobiletestorchestrator.ADB_PATH = orig_adb_path
\ No newline at end of file
+            mobiletestorchestrator.ADB_PATH = orig_adb_path
+
+
+class TestLogcatTagDemuxer:
+
+    class Collector(LineParser):
+
+        def __init__(self):
+            self.lines = []
+
+        def parse_line(self, line: str) -> None:
+            self.lines.append(line)
+
+    def test_parse_line(self):
+        short, long_ = self.Collector(), self.Collector()
+        demuxer = LogcatTagDemuxer({"MTO": ("I", short), "MTO-LongTag": ("D", long_)})
+        demuxer.parse_lines([
+            "--------- beginning of main\n",
+            "I/MTO     ( 1234): short tag line\n",
+            "D/MTO-LongTag( 1234): long tag line\n",
+            "I/Other   ( 1234): not monitored\n",
+        ])
+        assert short.lines == ["I/MTO     ( 1234): short tag line\n"]
+        assert long_.lines == ["D/MTO-LongTag( 1234): long tag line\n"]
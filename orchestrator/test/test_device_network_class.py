@@ -9,6 +9,7 @@ from mobiletestorchestrator.device_networking import DeviceConnectivity, AsyncDe
 
 class TestDeviceConnectivity:
 
+    @pytest.mark.slow
     def test_check_network_connect(self, device: Device):
         assert DeviceConnectivity(device).check_network_connection("localhost", count=3) == 0
 
@@ -35,9 +36,6 @@ class TestDeviceConnectivity:
 
 class TestDeviceConnectivityAsync:
 
-    async def test_check_network_connect(self, device: Device):
-        assert await AsyncDeviceConnectivity(device).check_network_connection("localhost", count=3) == 0
-
     async def test_port_forward(self, device: Device):
         device_network = AsyncDeviceConnectivity(device)
         await device_network.port_forward(32451, 29323)
@@ -58,6 +56,7 @@ class TestDeviceConnectivityAsync:
         assert "29323" not in output
         assert "32451" not in output
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_check_network_connect(self, device: Device):
         device_network = AsyncDeviceConnectivity(device)
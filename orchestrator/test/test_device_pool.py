@@ -3,6 +3,7 @@ from typing import List
 
 import pytest
 
+from mobiletestorchestrator.device import ONLINE_DEVICE_PATTERN
 from mobiletestorchestrator.device_pool import AsyncDevicePool, AsyncEmulatorPool
 from mobiletestorchestrator.emulators import Emulator
 
@@ -30,3 +31,13 @@ class TestDevicePool:
         with pytest.raises(Exception) as e:
             assert 'discovered' in str(e)
             await q_class.discover(filt=lambda x: False)  # all devices filtered out
+
+    def test_online_device_pattern(self):
+        adb_devices_output = "List of devices attached\n" \
+                             "emulator-5554\tdevice\n" \
+                             "emulator-5556\toffline\n" \
+                             "0123456789ABCDEF\tunauthorized\n" \
+                             "R58M123ABC\tdevice\n" \
+                             "\n"
+        assert [match.group(1) for match in ONLINE_DEVICE_PATTERN.finditer(adb_devices_output)] == \
+            ["emulator-5554", "R58M123ABC"]
@@ -1,6 +1,5 @@
 import sys
 
-import getpass
 from queue import Empty
 
 import asyncio
@@ -180,6 +180,8 @@ at android.support.test.internal.runner.TestExecutor.execute(TestExecutor.java:5
 at android.support.test.runner.AndroidJUnitRunner.onStart(AndroidJUnitRunner.java:240)
 at android.app.Instrumentation$InstrumentationThread.run(Instrumentation.java:1741)""".strip()
 
+    EXAMPLE_LINES = tuple(example_output.splitlines())
+
     def test_parse_lines(self):
         got_test_passed = False
         got_test_ignored = False
@@ -214,15 +216,35 @@ at android.app.Instrumentation$InstrumentationThread.run(Instrumentation.java:17
 
         parser = InstrumentationOutputParser("test_run")
         parser.add_execution_listener(Listener())
-
-        for line in self.example_output.splitlines():
-            parser.parse_line(line)
+        parser.parse_lines(TestInstrumentationOutputParser.EXAMPLE_LINES)
 
         assert got_test_passed is True
         assert got_test_assumption_failure is True
         assert got_test_failed is True
         assert got_test_ignored is False
 
+    def test_parse_lines_batched(self):
+
+        class Listener(self.EmptyListener):
+
+            def __init__(self):
+                self.ended_tests = []
+
+            def test_ended(self, test_run_name: str, class_name: str, test_name: str, **kwargs: Optional[Any]):
+                self.ended_tests.append((class_name, test_name))
+
+        batched_listener = Listener()
+        parser = InstrumentationOutputParser("test_run", batched_listener)
+        parser.parse_lines(TestInstrumentationOutputParser.EXAMPLE_LINES)
+
+        line_listener = Listener()
+        parser = InstrumentationOutputParser("test_run", line_listener)
+        for line in TestInstrumentationOutputParser.EXAMPLE_LINES:
+            parser.parse_line(line)
+
+        assert line_listener.ended_tests
+        assert batched_listener.ended_tests == line_listener.ended_tests
+
     def test__process_test_code(self):
         got_test_assumption_failure = False
         got_test_error = False
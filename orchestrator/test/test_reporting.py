@@ -0,0 +1,37 @@
+import datetime
+
+from mobiletestorchestrator.reporting import TestResult, TestStatus
+
+
+class TestTestStatus:
+
+    def test_rendering(self):
+        assert str(TestStatus.PASSED) == "PASSED"
+        assert f"{TestStatus.FAILED}" == "FAILED"
+        assert "{:>8}".format(TestStatus.IGNORED) == " IGNORED"
+        assert repr(TestStatus.PASSED) == "<TestStatus.PASSED: 'PASSED'>"
+
+    def test_compares_as_str(self):
+        assert TestStatus.PASSED == "PASSED"
+        assert TestStatus("INCOMPLETE") is TestStatus.INCOMPLETE
+        assert {"PASSED": 1}[TestStatus.PASSED] == 1
+
+
+class TestTestResult:
+
+    def test_duration(self):
+        result = TestResult()
+        assert result.duration == 0.0
+        result.ended()
+        assert result.duration >= 0.0
+
+    def test_duration_falls_back_to_wall_clock(self):
+        result = TestResult()
+        result.end_time = result.start_time + datetime.timedelta(seconds=2.5)
+        assert result.duration == 2.5
+
+    def test_repr_excludes_private_fields(self):
+        result = TestResult()
+        result.ended()
+        assert "monotonic" not in repr(result)
+        assert "status" in repr(result)
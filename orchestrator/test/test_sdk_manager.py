@@ -21,10 +21,8 @@ class TestSdkManager:
 
         monkeypatch.setattr("mobiletestorchestrator.tooling.sdkmanager.SdkManager.bootstrap", mock_bootstrap)
         os.makedirs(tmp_dir.joinpath("tools").joinpath("bin"), exist_ok=True)
-        with open(tmp_dir.joinpath("tools").joinpath("bin").joinpath("sdkmanager"), 'w') as f:
-            pass
-        with open(tmp_dir.joinpath("tools").joinpath("bin").joinpath("avdmanager"), 'w') as f:
-            pass
+        tmp_dir.joinpath("tools").joinpath("bin").joinpath("sdkmanager").touch()
+        tmp_dir.joinpath("tools").joinpath("bin").joinpath("avdmanager").touch()
 
     def test_emulator_path(self, tmp_path: Path):
         tmp_dir = tmp_path / "sdk"
@@ -1,13 +1,14 @@
+import collections
 import logging
 import os
 from typing import Any, Optional
 
 import pytest
 import sys
+from pathlib import Path
 
 from mobiletestorchestrator.device_pool import AsyncDevicePool
 from mobiletestorchestrator.main import AndroidTestOrchestrator, TestSuite
-from mobiletestorchestrator.device import Device
 from mobiletestorchestrator.parsing import LineParser
 from mobiletestorchestrator.reporting import TestExecutionListener
 from mobiletestorchestrator.testprep import EspressoTestSetup
@@ -16,9 +17,64 @@ from mobiletestorchestrator.testprep import EspressoTestSetup
 log = logging.getLogger(__name__)
 
 
+# noinspection PyShadowingNames
+class TestAndroidTestOrchestratorUnit(object):
+    """
+    Tests of argument validation that need no device/emulator
+    """
+
+    @pytest.mark.asyncio
+    async def test_invalid_test_timesout(self, artifact_dir: Path):
+        with pytest.raises(ValueError):
+            # individual test time greater than overall timeout for suite
+            async with AndroidTestOrchestrator(artifact_dir=str(artifact_dir),
+                                               max_test_suite_time=1, max_test_time=10):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_nonexistent_artifact_dir(self):
+        with pytest.raises(FileNotFoundError):
+            # individual test time greater than overall timeout for suite
+            with AndroidTestOrchestrator(artifact_dir="/no/such/dir"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_invalid_artifact_dir_is_file(self):
+        with pytest.raises(FileExistsError):
+            # individual test time greater than overall timeout for suite
+            async with AndroidTestOrchestrator(artifact_dir=__file__):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_sized_test_plan_caps_worker_count(self, tmp_path: Path):
+        worker_count = 0
+
+        async def do_work(devices, test_plan, test_setup, start_gate):
+            nonlocal worker_count
+            worker_count += 1
+            # reserve a "device" but never pull from the plan, so the plan is never seen as exhausted
+            start_gate.release()
+
+        test_plan = (TestSuite(name="suite1", test_parameters={}), TestSuite(name="suite2", test_parameters={}))
+        async with AndroidTestOrchestrator(artifact_dir=str(tmp_path), max_device_count=4) as orchestrator:
+            orchestrator._do_work = do_work
+            test_setup = EspressoTestSetup.Builder(path_to_apk="app.apk", path_to_test_apk="test_app.apk").resolve()
+            await orchestrator.execute_test_plan(test_setup=test_setup, devices=None, test_plan=test_plan)
+        assert worker_count == len(test_plan)
+
+
 # noinspection PyShadowingNames
 class TestAndroidTestOrchestrator(object):
 
+    SUITES = (
+        TestSuite(name='test_suite1',
+                  test_parameters={"class": "com.linkedin.mtotestapp.InstrumentedTestAllSuccess#useAppContext"}),
+        TestSuite(name='test_suite2',
+                  test_parameters={"class": "com.linkedin.mtotestapp.InstrumentedTestAllSuccess#testSuccess"}),
+        TestSuite(name='test_suite3',
+                  test_parameters={"class": "com.linkedin.mtotestapp.InstrumentedTestSomeFailures"}),
+    )
+
     class TagListener(LineParser):
         """
         For capturing logcat output lines for test assertions
@@ -29,7 +85,7 @@ class TestAndroidTestOrchestrator(object):
             just capture lines to memory as they come ine
             """
             super().__init__()
-            self.lines = []
+            self.lines = collections.deque(maxlen=10_000)
 
         def parse_line(self, line: str):
             """
@@ -39,16 +95,16 @@ class TestAndroidTestOrchestrator(object):
             self.lines.append(line)
 
     @pytest.mark.asyncio
-    async def test_add_logcat_tag_monitor(self, tmpdir: str):
-        async with AndroidTestOrchestrator(artifact_dir=str(tmpdir),) as orchestrator:
+    async def test_add_logcat_tag_monitor(self, artifact_dir: Path):
+        async with AndroidTestOrchestrator(artifact_dir=str(artifact_dir),) as orchestrator:
             handler = TestAndroidTestOrchestrator.TagListener()
             orchestrator.add_logcat_monitor("TestTag", handler)
             assert orchestrator._tag_monitors.get('TestTag') == ('*', handler)
             orchestrator.add_logcat_monitor("TestTag2", handler, priority='I')
             assert orchestrator._tag_monitors.get('TestTag2') == ('I', handler)
 
-    def test_invalid_logcat_tag_monitor_invocations(self, tmpdir):
-        orchestrator = AndroidTestOrchestrator(artifact_dir=str(tmpdir))
+    def test_invalid_logcat_tag_monitor_invocations(self, artifact_dir: Path):
+        orchestrator = AndroidTestOrchestrator(artifact_dir=str(artifact_dir))
         handler = TestAndroidTestOrchestrator.TagListener()
         with pytest.raises(ValueError):
             orchestrator.add_logcat_monitor("TestTag3", handler, priority='Bogus')
@@ -56,28 +112,6 @@ class TestAndroidTestOrchestrator(object):
         with pytest.raises(ValueError):
             orchestrator.add_logcat_monitor("TestTag", handler)  # duplicate tag/priority
 
-    @pytest.mark.asyncio
-    async def test_invalid_test_timesout(self, device: Device, tmpdir):
-        with pytest.raises(ValueError):
-            # individual test time greater than overall timeout for suite
-            async with AndroidTestOrchestrator(artifact_dir=str(tmpdir),
-                                               max_test_suite_time=1, max_test_time=10):
-                pass
-
-    @pytest.mark.asyncio
-    async def test_nonexistent_artifact_dir(self):
-        with pytest.raises(FileNotFoundError):
-            # individual test time greater than overall timeout for suite
-            with AndroidTestOrchestrator(artifact_dir="/no/such/dir"):
-                pass
-
-    @pytest.mark.asyncio
-    async def test_invalid_artifact_dir_is_file(self):
-        with pytest.raises(FileExistsError):
-            # individual test time greater than overall timeout for suite
-            async with AndroidTestOrchestrator(artifact_dir=__file__):
-                pass
-
     @pytest.mark.asyncio
     async def test_execute_test_suite(self,
                                       device_pool: AsyncDevicePool,
@@ -86,64 +120,73 @@ class TestAndroidTestOrchestrator(object):
                                       tmpdir):
 
         class TestExpectations(TestExecutionListener):
+            """
+            Records events as they stream in; expectations are checked once execution completes
+            """
 
             def __init__(self):
-                self.expected_test_class = {
-                    'test_suite1': "com.linkedin.mtotestapp.InstrumentedTestAllSuccess",
-                    'test_suite2': "com.linkedin.mtotestapp.InstrumentedTestAllSuccess",
-                    'test_suite3': "com.linkedin.mtotestapp.InstrumentedTestSomeFailures"
-                }
-                self.test_count = 0
-                self.test_suites = []
+                self.events = []
 
             def test_suite_failed(self, test_run_name: str, error_message: str):
-                assert test_run_name in self.expected_test_class.keys()
-                assert False, "did not expect test process to error; \n%s" % error_message
+                self.events.append(("suite_failed", test_run_name, error_message))
 
             def test_assumption_failure(self, test_run_name: str, class_name: str, test_name: str, stack_trace: str):
-                assert False, "did not expect test assumption failure"
+                self.events.append(("assumption_failure", test_run_name, class_name, test_name))
 
             def test_suite_ended(self, test_run_name: str, duration: float = -1.0, **kwargs: Optional[Any]) -> None:
-                self.test_suites.append(test_run_name)
-                assert test_run_name in self.expected_test_class.keys()
+                self.events.append(("suite_ended", test_run_name))
 
             def test_started(self, test_run_name: str, class_name: str, test_name: str):
-                assert test_run_name in self.expected_test_class.keys()
+                self.events.append(("started", test_run_name, class_name, test_name))
 
             def test_ended(self, test_run_name: str, class_name: str, test_name: str, **kwargs):
-                self.test_count += 1
-                assert test_run_name in self.expected_test_class.keys()
-                assert test_name in ["useAppContext", "testSuccess", "testFail"]
-                assert class_name in self.expected_test_class.values()
+                self.events.append(("ended", test_run_name, class_name, test_name))
 
             def test_failed(self, test_run_name: str, class_name: str, test_name: str, stack_trace: str):
-                assert class_name == 'com.linkedin.mtotestapp.InstrumentedTestSomeFailures'
-                assert test_name == "testFail"  # this test case is designed to be failed
+                self.events.append(("failed", test_run_name, class_name, test_name))
 
             def test_ignored(self, test_run_name: str, class_name: str, test_name: str):
-                assert False, "no skipped tests should be present"
+                self.events.append(("ignored", test_run_name, class_name, test_name))
 
             def test_suite_started(self, test_run_name: str, count: int = 0):
                 print("Started test suite %s" % test_run_name)
-                assert test_run_name in self.expected_test_class.keys()
+                self.events.append(("suite_started", test_run_name))
 
-        def test_generator():
-            yield (TestSuite(name='test_suite1',
-                             test_parameters={"class": "com.linkedin.mtotestapp.InstrumentedTestAllSuccess#useAppContext"}))
-            yield (TestSuite(name='test_suite2',
-                             test_parameters={"class": "com.linkedin.mtotestapp.InstrumentedTestAllSuccess#testSuccess"}))
-            yield (TestSuite(name='test_suite3',
-                             test_parameters={"class": "com.linkedin.mtotestapp.InstrumentedTestSomeFailures"}))
+        expected_test_class = {
+            'test_suite1': "com.linkedin.mtotestapp.InstrumentedTestAllSuccess",
+            'test_suite2': "com.linkedin.mtotestapp.InstrumentedTestAllSuccess",
+            'test_suite3': "com.linkedin.mtotestapp.InstrumentedTestSomeFailures"
+        }
+        expected_test_names = frozenset(["useAppContext", "testSuccess", "testFail"])
 
         listener = TestExpectations()
         test_setup = EspressoTestSetup.Builder(path_to_apk=support_app, path_to_test_apk=support_test_app).resolve()
         async with AndroidTestOrchestrator(artifact_dir=str(tmpdir)) as orchestrator:
             orchestrator.add_test_listener(listener)
-            await orchestrator.execute_test_plan(test_plan=test_generator(),
+            await orchestrator.execute_test_plan(test_plan=self.SUITES,
                                                  test_setup=test_setup,
                                                  devices=device_pool)
-        assert listener.test_count == 4
-        assert set(listener.expected_test_class.keys()) == set(listener.test_suites)
+
+        test_count = 0
+        test_suites = []
+        for event, test_run_name, *details in listener.events:
+            # test suites can run concurrently across devices, so look up expectations per suite name
+            assert test_run_name in expected_test_class
+            assert event not in ("suite_failed", "assumption_failure", "ignored"), \
+                "did not expect test process to error, assumption failures or skipped tests: %s" % details
+            if event == "suite_ended":
+                test_suites.append(test_run_name)
+            elif event in ("ended", "failed"):
+                class_name, test_name = details
+                assert class_name == expected_test_class[test_run_name]
+                assert test_name in expected_test_names
+                if event == "ended":
+                    test_count += 1
+                else:
+                    assert class_name == 'com.linkedin.mtotestapp.InstrumentedTestSomeFailures'
+                    assert test_name == "testFail"  # this test case is designed to be failed
+        assert test_count == 4
+        assert set(expected_test_class.keys()) == set(test_suites)
 
     @pytest.mark.asyncio
     async def test_execute_test_suite_orchestrated(self, device_pool: AsyncDevicePool, support_app: str,
@@ -222,15 +265,14 @@ class TestAndroidTestOrchestrator(object):
                 expected_test_suite = "test_suite%d" % test_suite_count
                 assert test_run_name == expected_test_suite
 
-        def test_generator():
-            yield (TestSuite(name='test_suite1',
-                             test_parameters={"class": "com.linkedin.mtotestapp.InstrumentedTestAllSuccess"}))
+        test_plan = (TestSuite(name='test_suite1',
+                               test_parameters={"class": "com.linkedin.mtotestapp.InstrumentedTestAllSuccess"}),)
 
         test_setup = EspressoTestSetup.Builder(path_to_apk=support_app, path_to_test_apk=support_test_app).\
             add_foreign_apks([test_services_apk, android_orchestrator_apk]).resolve()
         async with AndroidTestOrchestrator(artifact_dir=str(tmpdir), run_under_orchestration=True) as orchestrator:
             orchestrator.add_test_listener(TestExpectations())
-            await orchestrator.execute_test_plan(test_plan=test_generator(),
+            await orchestrator.execute_test_plan(test_plan=test_plan,
                                                  test_setup=test_setup,
                                                  devices=device_pool)
 
@@ -33,10 +33,7 @@ class TestTestApplication:
     def test_list_runners(self, install_app, support_test_app):
         test_app = install_app(TestApplication, support_test_app)
         instrumentation = test_app.list_runners()
-        for instr in instrumentation:
-            if "Runner" in instr:
-                return
-        assert False, "failed to get instrumentation runner"
+        assert any("Runner" in instr for instr in instrumentation), "failed to get instrumentation runner"
 
     def test_invalid_apk_has_no_test_app(self, support_app, device):
         with pytest.raises(Exception) as exc_info:
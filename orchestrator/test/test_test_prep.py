@@ -1,6 +1,4 @@
 import os
-import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -13,38 +11,73 @@ from mobiletestorchestrator.testprep import EspressoTestSetup
 class TestEspressoTestPreparation:
 
     @pytest.mark.asyncio
-    async def test_upload_test_vectors(self, device, support_app, support_test_app, tmp_path: Path):
-        tmp_dir = tmp_path / "test_vectors"
-        tmp_dir.mkdir(exist_ok=True)
-        root = os.path.join(str(tmp_dir), "data_files")
-        os.makedirs(root)
-        tv_dir = os.path.join(root, "test_vectors")
-        os.makedirs(tv_dir)
-        with open(os.path.join(tv_dir, "tv-1.txt"), 'w'):
-            pass
-        with open(os.path.join(tv_dir, "tv-2.txt"), 'w'):
-            pass
-
+    async def test_upload_test_vectors(self, device, support_app, support_test_app, test_vectors_root: Path):
+        root = str(test_vectors_root)
         bundle = EspressoTestSetup.Builder(
             path_to_apk=support_app,
             path_to_test_apk=support_test_app,
             grant_all_user_permissions=False).upload_test_vectors(root).resolve()
+        storage = DeviceStorage(device)
+        remote_tv_dir = "/".join([storage.external_storage_location, "test_vectors"])
         async with bundle.apply(device) as test_app:
             assert test_app
-            storage = DeviceStorage(device)
-            test_dir = os.path.join(str(tmp_dir), "test_download")
-            storage.pull(remote_path="/".join([storage.external_storage_location, "test_vectors"]),
-                         local_path=os.path.join(test_dir))
-            assert os.path.exists(os.path.join(test_dir, "tv-1.txt"))
-            assert os.path.exists(os.path.join(test_dir, "tv-2.txt"))
+            # listing is enough to verify the upload; no need to pull the content back (pull is covered elsewhere)
+            remote_files = storage.list(remote_tv_dir)
+            assert "tv-1.txt" in remote_files
+            assert "tv-2.txt" in remote_files
 
         # cleanup occurred on exit of context manager, so...
-        test_dir2 = os.path.join(str(tmp_dir), "no_tv_download")
-        os.makedirs(test_dir2)
-        storage.pull(remote_path="/".join([storage.external_storage_location, "test_vectors"]),
-                     local_path=os.path.join(test_dir2))
-        assert not os.path.exists(os.path.join(test_dir2, "tv-1.txt"))
-        assert not os.path.exists(os.path.join(test_dir2, "tv-2.txt"))
+        remote_files = storage.list(remote_tv_dir)
+        assert "tv-1.txt" not in remote_files
+        assert "tv-2.txt" not in remote_files
+
+    @pytest.mark.asyncio
+    async def test_upload_test_vectors_archive(self, device, support_app, support_test_app, test_vectors_root: Path):
+        if not device.api_level or device.api_level < EspressoTestSetup.MIN_API_LEVEL_ARCHIVE_UPLOAD:
+            pytest.skip("archive upload requires Android N or later")
+        bundle = EspressoTestSetup.Builder(
+            path_to_apk=support_app,
+            path_to_test_apk=support_test_app,
+            grant_all_user_permissions=False).upload_test_vectors(str(test_vectors_root)).resolve()
+        storage = DeviceStorage(device)
+        remote_tv_dir = "/".join([storage.external_storage_location, "test_vectors"])
+        relative_paths, archive_path = await bundle._archive(str(test_vectors_root))
+        # archive is built only once per setup, no matter how many devices it is uploaded to
+        assert await bundle._archive(str(test_vectors_root)) == (relative_paths, archive_path)
+        remote_paths = await EspressoTestSetup._upload_archive(device, archive_path, relative_paths)
+        try:
+            remote_files = storage.list(remote_tv_dir)
+            assert "tv-1.txt" in remote_files
+            assert "tv-2.txt" in remote_files
+            assert sorted(remote_paths) == sorted(["/".join([remote_tv_dir, "tv-1.txt"]),
+                                                   "/".join([remote_tv_dir, "tv-2.txt"])])
+        finally:
+            for remote_path in remote_paths:
+                storage.remove(remote_path)
+            bundle.cleanup()
+        assert not os.path.exists(archive_path)
+
+    @pytest.mark.asyncio
+    async def test_archive_failed_build_evicted(self, test_vectors_root: Path, monkeypatch):
+        bundle = EspressoTestSetup.Builder(path_to_apk="app.apk", path_to_test_apk="test_app.apk").resolve()
+        build_archive = EspressoTestSetup._build_archive
+
+        def failing_build_archive(root_path: str, archive_path: str):
+            raise IOError("no space left on device")
+
+        monkeypatch.setattr(EspressoTestSetup, "_build_archive", staticmethod(failing_build_archive))
+        with pytest.raises(IOError):
+            await bundle._archive(str(test_vectors_root))
+        assert not bundle._archives
+        # next device to be set up gets a fresh build
+        monkeypatch.setattr(EspressoTestSetup, "_build_archive", staticmethod(build_archive))
+        relative_paths, archive_path = await bundle._archive(str(test_vectors_root))
+        assert sorted(relative_paths) == [os.path.join("test_vectors", "tv-1.txt"),
+                                          os.path.join("test_vectors", "tv-2.txt")]
+        assert os.path.isfile(archive_path)
+        bundle.cleanup()
+        assert not os.path.exists(archive_path)
+        assert not bundle._archives
 
     def test_upload_test_vectors_no_such_files(self, device, support_app, support_test_app,):
         with pytest.raises(IOError):
@@ -64,7 +64,7 @@ class TestWorker:
         expectations = self.Expectations(tests)
         test_setup = EspressoTestSetup.Builder(path_to_apk=support_app,
                                                path_to_test_apk=support_test_app).resolve()
-        worker = Worker(device, _async_iter_adapter(iter(test_suites)),
+        worker = Worker(device, _async_iter_adapter(test_suites),
         test_setup, artifact_dir=tmp_dir, listeners=[expectations])
         await worker.run(test_timeout=20)
         assert expectations.test_count == 6